@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from .cli import app
+import sys
+
+from . import __version__
 
 
 def main() -> None:
@@ -8,7 +10,14 @@ def main() -> None:
     Console entrypoint for `wrkr-tools-compare-perf`.
 
     This is intentionally tiny: all CLI definitions live in `wrkr_tools_compare_perf.cli`.
+    A bare `--version` is answered here, before typer/click (most of the startup cost) load.
     """
+    if sys.argv[1:] == ["--version"]:
+        print(f"wrkr-tools-compare-perf {__version__}")
+        return
+
+    from .cli import app
+
     app()
 
 
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import re
-from dataclasses import dataclass
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
+from typing import Final
 
 from rich.text import Text
 
 from .build import BuildPlan, build_binaries
-from .cases import default_grpc_cases, default_http_cases, is_too_slow, run_grpc_case, run_http_case
+from .cases import (
+    GrpcCase,
+    GrpcCaseOutcome,
+    HttpCase,
+    HttpCaseOutcome,
+    default_grpc_cases,
+    default_http_cases,
+    is_too_slow,
+    run_grpc_case,
+    run_http_case,
+)
 from .config import (
+    ColorMode,
     Config,
     ConfigError,
     Ratios,
@@ -18,8 +31,9 @@ from .config import (
     validate_tuning,
 )
 from .parse import Rps
+from .report import SummaryKind, SummaryLine
 from .server import TestServer
-from .tool_detection import detect_tools
+from .tool_detection import ToolDetectionError, detect_load_tools, detect_server_bin
 from .ui import RunUI
 
 
@@ -35,21 +49,21 @@ class OverallOutcome:
         return self.failures == 0
 
 
-def run(cfg: Config, *, color: str = "auto") -> OverallOutcome:
+def run(cfg: Config, *, color: ColorMode = "auto") -> OverallOutcome:
     """
     Orchestrate a full perf comparison run.
 
     This coordinates:
       - config validation
       - optional builds
-      - tool detection (wrk/k6 optional)
       - starting wrkr-testserver and acquiring targets
+      - tool detection (wrk/k6 optional), overlapped with the server startup
       - running all default HTTP and gRPC cases
       - the cross-protocol gate (wrkr gRPC vs wrk hello), when possible
 
     The caller (CLI) is responsible for translating failures into exit codes.
     """
-    _validate_config(cfg)
+    cfg = _validate_config(cfg)
 
     ui = RunUI(color=color)
     ui.start()
@@ -58,79 +72,112 @@ def run(cfg: Config, *, color: str = "auto") -> OverallOutcome:
         if cfg.tuning.build:
             build_binaries(BuildPlan(root=cfg.root, native=cfg.tuning.native), ui=ui)
 
-        with ui.step("detect tools"):
-            tools = detect_tools(cfg.root, cfg.requirements)
+        # Only the testserver binary is needed to launch the server; PATH probing for the load
+        # generators runs in the background while the server binds its sockets.
+        server_bin = detect_server_bin(cfg.root)
+        detect_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detect-tools")
+        load_tools = detect_pool.submit(
+            detect_load_tools, cfg.root, cfg.requirements, server_bin=server_bin
+        )
+        detect_pool.shutdown(wait=False)
 
         failures = 0
         failure_summary: list[str] = []
-        case_summaries: list[tuple[str, ...]] = []
+        case_summaries: list[Sequence[SummaryLine]] = []
 
         ui.set_status(
             {
                 "duration": cfg.tuning.duration,
-                "wrk": f"threads={cfg.tuning.wrk_threads} conns={cfg.tuning.wrk_connections}",
-                "wrkr": f"vus={cfg.tuning.wrkr_vus}",
-                "k6": f"vus={cfg.effective_k6_vus()}",
+                "wrk": cfg.status_wrk_str,
+                "wrkr": cfg.status_wrkr_str,
+                "k6": cfg.status_k6_str,
             }
         )
 
-        http_cases = default_http_cases(cfg)
-        grpc_cases = default_grpc_cases(cfg)
-
-        # Once we know which tools are present, compute a stable total step count so
-        # progress bars can be meaningful even in Docker/CI logs.
-        steps = 0
-        if cfg.tuning.build:
-            steps += 2  # cargo build wrkr-testserver + wrkr
-        steps += 1  # detect tools
-        steps += 1  # wait for testserver
-        steps += 1  # cross-protocol gate
-
-        for _ in http_cases:
-            if tools.wrk is not None:
-                steps += 1
-            steps += 1  # wrkr
-            if tools.k6 is not None:
-                steps += 1
-        for _ in grpc_cases:
-            steps += 1  # wrkr
-            if tools.k6 is not None:
-                steps += 1
-
-        ui.set_total_steps(steps)
-
         hello_wrk_rps: Rps | None = None
         grpc_first_wrkr_rps: Rps | None = None
 
         targets_http_url: str | None = None
         targets_grpc_url: str | None = None
 
-        server = TestServer.start(
-            root=cfg.root,
-            server_bin=tools.wrkr_testserver,
-            on_log=lambda m: ui.tail(m, style="dim"),
-        )
+        try:
+            server = TestServer.start(
+                root=cfg.root,
+                server_bin=server_bin,
+                on_log=lambda m: ui.tail(m, style="dim"),
+            )
+        except Exception as e:
+            # The detection future would otherwise be dropped unread; a missing tool is the
+            # more actionable of the two failures, so report it first.
+            if not load_tools.cancel():
+                detect_err = load_tools.exception()
+                if isinstance(detect_err, ToolDetectionError):
+                    raise detect_err from e
+            raise
         with server:
+            # Popen returns before the server has bound its sockets; build the case lists
+            # in that window rather than ahead of the launch.
+            http_cases = default_http_cases(cfg)
+            grpc_cases = default_grpc_cases(cfg)
+
             with ui.step("wait for testserver"):
                 targets = server.wait_for_targets(
                     timeout_s=5.0,
                     on_log=lambda m: ui.tail(m, style="dim"),
                 )
 
+            with ui.step("detect tools"):
+                tools = load_tools.result()
+
+            # Once we know which tools are present, compute a stable total step count so
+            # progress bars can be meaningful even in Docker/CI logs.
+            steps = 0
+            if cfg.tuning.build:
+                steps += 1  # cargo build wrkr + wrkr-testserver
+            steps += 1  # detect tools
+            steps += 1  # wait for testserver
+            steps += 1  # cross-protocol gate
+
+            has_wrk = tools.wrk is not None
+            has_k6 = tools.k6 is not None
+            steps += len(http_cases) * (1 + has_wrk + has_k6)  # wrkr + optional wrk/k6
+            steps += len(grpc_cases) * (1 + has_k6)  # wrkr + optional k6
+
+            ui.set_total_steps(steps)
+
             targets_http_url = targets.http_url
             targets_grpc_url = targets.grpc_url
 
             ui.set_status({"http_url": targets.http_url, "grpc_url": targets.grpc_url})
 
-            # HTTP cases
-            for i, case in enumerate(http_cases):
-                outcome = run_http_case(
+            def run_http(case: HttpCase) -> HttpCaseOutcome:
+                return run_http_case(
                     cfg=cfg,
                     tools=tools,
                     base_url=targets.http_url,
                     case=case,
                     ui=ui,
                 )
+
+            def run_grpc(case: GrpcCase) -> GrpcCaseOutcome:
+                return run_grpc_case(
+                    cfg=cfg,
+                    tools=tools,
+                    grpc_url=targets.grpc_url,
+                    case=case,
+                    ui=ui,
+                )
+
+            http_outcomes, grpc_outcomes = _run_cases(
+                http_cases=http_cases,
+                grpc_cases=grpc_cases,
+                run_http=run_http,
+                run_grpc=run_grpc,
+                parallel_cases=cfg.tuning.parallel_cases,
+            )
+
+            # HTTP cases
+            for i, (case, outcome) in enumerate(zip(http_cases, http_outcomes, strict=True)):
                 failures += outcome.failures
                 for msg in outcome.failure_messages:
                     failure_summary.append(f"HTTP {case.title}: {msg}")
@@ -141,14 +188,7 @@ def run(cfg: Config, *, color: str = "auto") -> OverallOutcome:
                     hello_wrk_rps = outcome.wrk_rps
 
             # gRPC cases
-            for i, case in enumerate(grpc_cases):
-                outcome = run_grpc_case(
-                    cfg=cfg,
-                    tools=tools,
-                    grpc_url=targets.grpc_url,
-                    case=case,
-                    ui=ui,
-                )
+            for i, (case, outcome) in enumerate(zip(grpc_cases, grpc_outcomes, strict=True)):
                 failures += outcome.failures
                 for msg in outcome.failure_messages:
                     failure_summary.append(f"gRPC {case.title}: {msg}")
@@ -180,54 +220,65 @@ def run(cfg: Config, *, color: str = "auto") -> OverallOutcome:
         ui.stop()
         stopped = True
 
-        console = ui.console
-
-        console.print(Text("CONDITIONS:", style="bold cyan"))
-        console.print(f"- duration={cfg.tuning.duration}")
-        console.print(
-            "- "
-            f"wrkr_vus={cfg.tuning.wrkr_vus} "
-            f"k6_vus={cfg.effective_k6_vus()} "
-            f"wrk_threads={cfg.tuning.wrk_threads} "
-            f"wrk_connections={cfg.tuning.wrk_connections}"
+        # Render the whole report into one Text and print it once: a single render pass and
+        # write instead of one per line.
+        report = Text()
+        report.append("CONDITIONS:\n", style="bold cyan")
+        report.append(f"- duration={cfg.tuning.duration}\n")
+        report.append(f"- {cfg.conditions_load_str}\n")
+        report.append(
+            f"- targets: http_url={targets_http_url or '-'} grpc_url={targets_grpc_url or '-'}\n"
         )
-        console.print(
-            f"- targets: http_url={targets_http_url or '-'} grpc_url={targets_grpc_url or '-'}"
-        )
-        console.print(Text(f"- tool[wrkr]={tools.wrkr}"))
-        console.print(Text(f"- tool[wrkr-testserver]={tools.wrkr_testserver}"))
-        console.print(Text(f"- tool[wrk]={'-' if tools.wrk is None else tools.wrk}"))
-        console.print(Text(f"- tool[k6]={'-' if tools.k6 is None else tools.k6}"))
-        console.print(
-            "- order: HTTP runs wrk -> wrkr -> k6; gRPC runs wrkr -> k6 (single shared testserver)"
+        report.append(f"- tool[wrkr]={tools.wrkr}\n")
+        report.append(f"- tool[wrkr-testserver]={tools.wrkr_testserver}\n")
+        report.append(f"- tool[wrk]={'-' if tools.wrk is None else tools.wrk}\n")
+        report.append(f"- tool[k6]={'-' if tools.k6 is None else tools.k6}\n")
+        report.append(
+            "- order: HTTP runs wrk -> wrkr -> k6; gRPC runs wrkr -> k6 (single shared testserver)\n"
         )
+        if cfg.tuning.parallel_cases > 1:
+            report.append(
+                f"- WARNING: parallel_cases={cfg.tuning.parallel_cases}; cases after the first "
+                "HTTP/gRPC case share the testserver concurrently\n",
+                style="bold yellow",
+            )
+        if cfg.tuning.use_cache:
+            report.append(
+                "- WARNING: use_cache; unchanged tool runs were replayed from a previous run\n",
+                style="bold yellow",
+            )
+        if cfg.tuning.parallel_tools:
+            report.append(
+                "- WARNING: parallel_tools; each case runs its tools at the same time against "
+                "the testserver, so ratio gates are not meaningful\n",
+                style="bold yellow",
+            )
 
         if cfg.tuning.wrkr_vus != cfg.effective_k6_vus():
-            console.print(
-                Text(
-                    "- WARNING: wrkr_vus != k6_vus; comparisons are not under equal VU counts",
-                    style="bold yellow",
-                )
+            report.append(
+                "- WARNING: wrkr_vus != k6_vus; comparisons are not under equal VU counts\n",
+                style="bold yellow",
             )
         if cfg.tuning.wrk_connections != cfg.tuning.wrkr_vus:
-            console.print(
-                Text(
-                    "- WARNING: wrk_connections != wrkr_vus; wrk load intensity differs from wrkr VUs",
-                    style="bold yellow",
-                )
+            report.append(
+                "- WARNING: wrk_connections != wrkr_vus; wrk load intensity differs from wrkr VUs\n",
+                style="bold yellow",
             )
 
         if case_summaries:
-            console.print(Text("SUMMARY:", style="bold green"))
+            report.append("SUMMARY:\n", style="bold green")
             for block in case_summaries:
                 for line in block:
-                    console.print(_style_summary_line(line))
-                console.print("")
+                    report.append_text(_style_summary_line(line))
+                    report.append("\n")
+                report.append("\n")
 
         if failure_summary:
-            console.print(Text("FAILED:", style="bold red"))
+            report.append("FAILED:\n", style="bold red")
             for line in failure_summary:
-                console.print(Text(f"- {line}", style="red"))
+                report.append(f"- {line}\n", style="red")
+
+        ui.console.print(report, end="")
 
         return OverallOutcome(failures=failures)
     finally:
@@ -235,15 +286,58 @@ def run(cfg: Config, *, color: str = "auto") -> OverallOutcome:
             ui.stop()
 
 
-def _validate_config(cfg: Config) -> None:
+def _run_cases(
+    *,
+    http_cases: Sequence[HttpCase],
+    grpc_cases: Sequence[GrpcCase],
+    run_http: Callable[[HttpCase], HttpCaseOutcome],
+    run_grpc: Callable[[GrpcCase], GrpcCaseOutcome],
+    parallel_cases: int,
+) -> tuple[list[HttpCaseOutcome], list[GrpcCaseOutcome]]:
+    """
+    Run all cases and return their outcomes in case order.
+
+    With `parallel_cases=1` this is the classic sequential order (all HTTP, then all gRPC).
+    Otherwise the first HTTP and first gRPC cases still run alone, because they feed the
+    cross-protocol gate and must not be measured under contention; the remaining cases are
+    fanned out to a thread pool (each case mostly waits on its load generator subprocesses).
+    """
+    if parallel_cases <= 1:
+        return [run_http(c) for c in http_cases], [run_grpc(c) for c in grpc_cases]
+
+    http_outcomes = [run_http(c) for c in http_cases[:1]]
+    grpc_outcomes = [run_grpc(c) for c in grpc_cases[:1]]
+
+    with ThreadPoolExecutor(max_workers=parallel_cases, thread_name_prefix="case") as pool:
+        http_futures = _submit_cases(pool, http_cases[1:], run_http)
+        grpc_futures = _submit_cases(pool, grpc_cases[1:], run_grpc)
+        http_outcomes.extend(f.result() for f in http_futures)
+        grpc_outcomes.extend(f.result() for f in grpc_futures)
+
+    return http_outcomes, grpc_outcomes
+
+
+def _submit_cases[C, O](
+    pool: ThreadPoolExecutor, cases: Sequence[C], runner: Callable[[C], O]
+) -> list[Future[O]]:
+    return [pool.submit(runner, case) for case in cases]
+
+
+def _validate_config(cfg: Config) -> Config:
+    """Validate `cfg` and return it with `root` resolved to its canonical path."""
     if not isinstance(cfg.root, Path):
         raise ConfigError("Config.root must be a pathlib.Path")
 
-    if not cfg.root.exists():
-        raise ConfigError(f"wrkr root does not exist: {cfg.root}")
+    # One realpath() both checks existence and canonicalizes, so downstream consumers never
+    # need to re-resolve or re-check the root.
+    try:
+        root = cfg.root.resolve(strict=True)
+    except OSError as e:
+        raise ConfigError(f"wrkr root does not exist: {cfg.root}") from e
 
     validate_tuning(cfg.tuning)
     validate_ratios(cfg.ratios)
+    return cfg if root == cfg.root else replace(cfg, root=root)
 
 
 def _cross_protocol_gate(
@@ -257,7 +351,7 @@ def _cross_protocol_gate(
     Optional gate: wrkr gRPC RPS must be >= wrk GET /hello RPS * ratio.
 
     This is only applied when:
-      - wrk is installed (so hello wrk RPS exists)
+      - wrk is installed (so hello wrk RPS exists) and measured a non-zero rate
       - we have a gRPC wrkr RPS from the first gRPC case
     """
     if wrk_hello_rps is None:
@@ -270,10 +364,13 @@ def _cross_protocol_gate(
         ui.log(msg)
         return None
 
+    if wrk_hello_rps.value <= 0:
+        # Nothing to compare against; the ratio would be infinite and the gate always pass.
+        ui.log("INFO: wrkr-grpc/wrk-hello ratio skipped (wrk hello rps=0)")
+        return None
+
     ratio_ok = cfg.ratios.ratio_ok_grpc_wrkr_over_wrk_hello
-    ratio_actual = (
-        grpc_wrkr_rps.value / wrk_hello_rps.value if wrk_hello_rps.value > 0 else float("inf")
-    )
+    ratio_actual = grpc_wrkr_rps.value / wrk_hello_rps.value
 
     if is_too_slow(wrkr=grpc_wrkr_rps, other=wrk_hello_rps, ratio=ratio_ok, inclusive=True):
         msg = (
@@ -288,55 +385,56 @@ def _cross_protocol_gate(
     return None
 
 
-def _style_summary_line(line: str) -> Text:
-    # Make summary blocks scannable in CI logs.
-    t = Text(line)
-
-    if line.startswith("HTTP ") or line.startswith("gRPC "):
-        t.stylize("bold")
-        return t
-
-    if " scripts:" in line:
-        t.stylize("dim")
-        return t
-
-    # Color OK/FAIL/SKIP.
-    m = re.search(r"\b(OK|FAIL|SKIP)\b", line)
-    if m is not None:
-        word = m.group(1)
-        style = {"OK": "green", "FAIL": "red", "SKIP": "yellow"}[word]
-        t.stylize(style, m.start(1), m.end(1))
-
-    # Color rps values.
-    idx = 0
-    while True:
-        i = line.find("rps=", idx)
-        if i == -1:
-            break
-        j = i + 4
-        while j < len(line) and (line[j].isdigit() or line[j] == "." or line[j] == "-"):
-            j += 1
-        t.stylize("cyan", i + 4, j)
-        idx = j
+_STATUS_WORD_STYLE: Final[Mapping[str, str]] = {"OK": "green", "FAIL": "red", "SKIP": "yellow"}
 
-    # Color ratio_actual in gate lines based on threshold.
-    if "ratio_ok=" in line and "ratio_actual=" in line:
-        try:
-            ratio_ok_s = line.split("ratio_ok=", 1)[1].split()[0]
-            ratio_actual_s = line.split("ratio_actual=", 1)[1].split()[0]
-            ratio_ok = float(ratio_ok_s)
-            ratio_actual = float(ratio_actual_s)
-            ra_pos = line.find("ratio_actual=")
-            if ra_pos != -1:
-                ra_val_start = ra_pos + len("ratio_actual=")
-                ra_val_end = ra_val_start + len(ratio_actual_s)
-                t.stylize("green" if ratio_actual >= ratio_ok else "red", ra_val_start, ra_val_end)
-        except Exception:
-            pass
 
+def _style_summary_line(line: SummaryLine) -> Text:
+    # Make summary blocks scannable in CI logs. Runners tag each line with its kind, so
+    # each styler only does the work that kind can need.
+    return _STYLERS[line.kind](line)
+
+
+def _style_header(line: SummaryLine) -> Text:
+    return Text(line.text, style="bold")
+
+
+def _style_dim(line: SummaryLine) -> Text:
+    return Text(line.text, style="dim")
+
+
+def _style_plain(line: SummaryLine) -> Text:
+    # Plain lines may still carry a status word (e.g. `k6  : SKIP`).
+    t = Text(line.text)
+    if line.status is not None and line.status_span is not None:
+        t.stylize(_STATUS_WORD_STYLE[line.status], *line.status_span)
     return t
 
 
+def _style_rps(line: SummaryLine) -> Text:
+    t = _style_plain(line)
+    for start, end in line.rps_spans:
+        t.stylize("cyan", start, end)
+    return t
+
+
+def _style_ratio(line: SummaryLine) -> Text:
+    # Color ratio_actual in gate lines based on threshold.
+    t = Text(line.text)
+    if line.ratio_span is not None and line.ratio_ok is not None and line.ratio_actual is not None:
+        ok = line.ratio_actual >= line.ratio_ok
+        t.stylize("green" if ok else "red", *line.ratio_span)
+    return t
+
+
+_STYLERS: Final[Mapping[SummaryKind, Callable[[SummaryLine], Text]]] = {
+    "header": _style_header,
+    "dim": _style_dim,
+    "plain": _style_plain,
+    "rps": _style_rps,
+    "ratio": _style_ratio,
+}
+
+
 def config_from_values(
     *,
     root: Path,
@@ -347,6 +445,9 @@ def config_from_values(
     k6_vus: int | None = None,
     wrk_threads: int = 8,
     wrk_connections: int = 256,
+    parallel_cases: int = 1,
+    parallel_tools: bool = False,
+    use_cache: bool = False,
     # ratios
     ratio_ok_get_hello: float = 0.90,
     ratio_ok_post_json: float = 0.90,
@@ -374,15 +475,19 @@ def config_from_values(
             wrk_connections=wrk_connections,
             build=build,
             native=native,
+            parallel_cases=parallel_cases,
+            parallel_tools=parallel_tools,
+            use_cache=use_cache,
         ),
+        # NamedTuples: positional, in field order (see config.Ratios / config.ToolRequirements).
         ratios=Ratios(
-            ratio_ok_get_hello=ratio_ok_get_hello,
-            ratio_ok_post_json=ratio_ok_post_json,
-            ratio_ok_wfb_json_aggregate=ratio_ok_wfb_json_aggregate,
-            ratio_ok_wrkr_over_k6=ratio_ok_wrkr_over_k6,
-            ratio_ok_grpc_wrkr_over_k6=ratio_ok_grpc_wrkr_over_k6,
-            ratio_ok_wfb_grpc_aggregate_wrkr_over_k6=ratio_ok_wfb_grpc_aggregate_wrkr_over_k6,
-            ratio_ok_grpc_wrkr_over_wrk_hello=ratio_ok_grpc_wrkr_over_wrk_hello,
+            ratio_ok_get_hello,
+            ratio_ok_post_json,
+            ratio_ok_wfb_json_aggregate,
+            ratio_ok_wrkr_over_k6,
+            ratio_ok_grpc_wrkr_over_k6,
+            ratio_ok_wfb_grpc_aggregate_wrkr_over_k6,
+            ratio_ok_grpc_wrkr_over_wrk_hello,
         ),
-        requirements=ToolRequirements(require_wrk=require_wrk, require_k6=require_k6),
+        requirements=ToolRequirements(require_wrk, require_k6),
     )
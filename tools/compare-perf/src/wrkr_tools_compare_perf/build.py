@@ -1,11 +1,37 @@
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import json
+import os
+import tomllib
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Final
 
-from .exec import ExecError, run_checked_streaming
+from wrkr_tools_common.exec import ExecError, run_checked_streaming
+
+from .tool_detection import exe_name
 from .ui import RunUI
 
+# Written next to the binaries after a successful build; see `_build_fingerprint`.
+_STAMP_NAME = ".wrkr_build_stamp"
+
+_CARGO_BUILD_ARGV: Final[tuple[str, ...]] = (
+    "cargo",
+    "build",
+    "--release",
+    "-p",
+    "wrkr",
+    "-p",
+    "wrkr-testserver",
+    "--bin",
+    "wrkr",
+    "--bin",
+    "wrkr-testserver",
+)
+
 
 class BuildError(RuntimeError):
     """Raised when the Rust build step fails."""
@@ -18,6 +44,8 @@ class BuildPlan:
 
     This tool expects `wrkr` and `wrkr-testserver` to exist under:
       {root}/target/release/{bin}
+
+    `root` must be an existing, resolved path (the app validates it once up front).
     """
 
     root: Path
@@ -32,81 +60,172 @@ def build_binaries(plan: BuildPlan, *, ui: RunUI) -> None:
     """
     Build the required release binaries using cargo.
 
-    Builds:
+    Builds, in a single cargo invocation:
       - wrkr-testserver (package wrkr-testserver, bin wrkr-testserver)
-      - wrkr (workspace bin wrkr)
+      - wrkr (package wrkr, bin wrkr)
 
     Notes
     -----
-    We build as two separate cargo invocations, matching the old behavior and keeping
-    error messages focused.
+
+    Cargo output is forwarded to the UI tail in per-read batches rather than line by line:
+    a cold build emits thousands of lines and only the last few are ever shown.
+
+    Cargo is skipped entirely when the stamp written by the last successful build still
+    matches (same Cargo.lock, RUSTFLAGS, PROTOC, crate sources and binaries); even a no-op
+    `cargo build` costs seconds of fingerprint checking.
 
     Raises
     ------
     BuildError
         If any cargo invocation fails.
     """
-    root = plan.root.resolve()
-    if not root.exists():
-        raise BuildError(f"WRKR root does not exist: {root}")
+    root = plan.root
 
     env: dict[str, str] = {}
     rf = plan.rustflags()
     if rf:
         env["RUSTFLAGS"] = rf
 
+    stamp_path = root / "target" / "release" / _STAMP_NAME
+    if _read_stamp(stamp_path) == _build_fingerprint(root, rf):
+        ui.log("build: up to date (cached)", style="bold")
+        return
+
     ui.log("Building release binaries...", style="bold")
 
     try:
-        # Build wrkr-testserver first (needed for server startup).
-        with ui.step("build: wrkr-testserver"):
-            ui.set_current_command(
-                label="cargo",
-                argv=[
-                    "cargo",
-                    "build",
-                    "--release",
-                    "-p",
-                    "wrkr-testserver",
-                    "--bin",
-                    "wrkr-testserver",
-                ],
-                cwd=root,
-                env=env or None,
-            )
+        # One invocation for both binaries shares cargo's resolver/fingerprint pass and lets
+        # it overlap codegen across the two crates. wrkr-testserver is needed for server
+        # startup; cargo produces both binaries before the command returns.
+        with ui.step("build: wrkr + wrkr-testserver"):
+            ui.set_current_command(label="cargo", argv=_CARGO_BUILD_ARGV, cwd=root, env=env or None)
             run_checked_streaming(
-                [
-                    "cargo",
-                    "build",
-                    "--release",
-                    "-p",
-                    "wrkr-testserver",
-                    "--bin",
-                    "wrkr-testserver",
-                ],
+                _CARGO_BUILD_ARGV,
                 cwd=root,
                 env=env or None,
                 label=None,
-                on_stdout_line=ui.tail,
-                on_stderr_line=lambda line: ui.tail(line, style="dim"),
-            )
-
-        # Build wrkr binary (used to run Lua scripts).
-        with ui.step("build: wrkr"):
-            ui.set_current_command(
-                label="cargo",
-                argv=["cargo", "build", "--release", "--bin", "wrkr"],
-                cwd=root,
-                env=env or None,
-            )
-            run_checked_streaming(
-                ["cargo", "build", "--release", "--bin", "wrkr"],
-                cwd=root,
-                env=env or None,
-                label=None,
-                on_stdout_line=ui.tail,
-                on_stderr_line=lambda line: ui.tail(line, style="dim"),
+                on_stdout_lines=ui.tail_many,
+                on_stderr_lines=lambda lines: ui.tail_many(lines, style="dim"),
             )
 
     except ExecError as e:
         raise BuildError(str(e)) from e
+
+    _write_stamp(stamp_path, _build_fingerprint(root, rf))
+
+
+def _build_fingerprint(root: Path, rustflags: str | None) -> dict[str, object]:
+    """
+    Describe everything a release build of our two binaries depends on.
+
+    Missing binaries are recorded as `None`, so a fingerprint taken before they exist
+    never matches one taken after a successful build.
+    """
+    release = root / "target" / "release"
+    try:
+        lock_sha256: str | None = hashlib.sha256((root / "Cargo.lock").read_bytes()).hexdigest()
+    except OSError:
+        lock_sha256 = None
+    return {
+        "cargo_lock_sha256": lock_sha256,
+        "rustflags": rustflags,
+        # wrkr-testserver's build script compiles its protos with `$PROTOC` when set.
+        "protoc": os.environ.get("PROTOC"),
+        "sources_mtime_ns": _newest_source_mtime_ns(root),
+        "wrkr_mtime_ns": _mtime_ns(release / exe_name("wrkr")),
+        "testserver_mtime_ns": _mtime_ns(release / exe_name("wrkr-testserver")),
+    }
+
+
+def _newest_source_mtime_ns(root: Path) -> int:
+    """Newest mtime across the workspace manifest files and every crate the build compiles."""
+    newest = 0
+    for name in ("Cargo.toml", "rust-toolchain.toml"):
+        newest = max(newest, _mtime_ns(root / name) or 0)
+
+    dirs = _crate_dirs(root)
+    while dirs:
+        try:
+            entries = list(os.scandir(dirs.pop()))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != "target":
+                    dirs.append(Path(entry.path))
+            else:
+                newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+    return newest
+
+
+def _crate_dirs(root: Path) -> list[Path]:
+    """
+    Workspace members (glob patterns expanded) plus every crate they reach through `path`
+    dependencies, e.g. `wrkr-http`, which is not a member but is compiled into `wrkr`.
+    """
+    workspace = _load_manifest(root / "Cargo.toml").get("workspace", {})
+    pending: list[Path] = []
+    for pattern in workspace.get("members", []):
+        if isinstance(pattern, str):
+            pending.extend(p for p in root.glob(pattern) if p.is_dir())
+    pending.extend(_path_dependencies(root, workspace.get("dependencies", {})))
+
+    seen: dict[str, Path] = {}
+    while pending:
+        crate = pending.pop()
+        key = os.path.normpath(crate)
+        if key in seen:
+            continue
+        seen[key] = crate
+        manifest = _load_manifest(crate / "Cargo.toml")
+        for table in _dependency_tables(manifest):
+            pending.extend(_path_dependencies(crate, table))
+    return list(seen.values())
+
+
+def _load_manifest(path: Path) -> dict[str, Any]:
+    try:
+        return tomllib.loads(path.read_text(encoding="utf-8"))
+    except (OSError, tomllib.TOMLDecodeError):
+        return {}
+
+
+def _dependency_tables(manifest: dict[str, Any]) -> Iterator[object]:
+    kinds = ("dependencies", "dev-dependencies", "build-dependencies")
+    yield from (manifest.get(k, {}) for k in kinds)
+    targets = manifest.get("target", {})
+    if isinstance(targets, dict):
+        for cfg in targets.values():
+            if isinstance(cfg, dict):
+                yield from (cfg.get(k, {}) for k in kinds)
+
+
+def _path_dependencies(base: Path, table: object) -> list[Path]:
+    if not isinstance(table, dict):
+        return []
+    return [
+        base / spec["path"]
+        for spec in table.values()
+        if isinstance(spec, dict) and isinstance(spec.get("path"), str)
+    ]
+
+
+def _mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_stamp(path: Path) -> dict[str, object] | None:
+    try:
+        v = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return v if isinstance(v, dict) else None
+
+
+def _write_stamp(path: Path, fingerprint: dict[str, object]) -> None:
+    # Best effort: a missing stamp only means the next run invokes cargo again.
+    with contextlib.suppress(OSError):
+        path.write_text(json.dumps(fingerprint, sort_keys=True), encoding="utf-8")
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Final
+
+from wrkr_tools_common.exec import RunResult
+
+# Bump when the key inputs or the pickled payload change shape.
+_CACHE_VERSION = b"3"
+
+# Directories next to a script that it loads at run time (Lua modules, gRPC proto files).
+_SCRIPT_SUPPORT_DIRS: Final = ("lib", "protos")
+
+
+def cache_dir() -> Path:
+    """Directory holding cached runs: `$XDG_CACHE_HOME/wrkr-compare-perf` (or `~/.cache/...`)."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "wrkr-compare-perf"
+
+
+def run_cache_key(
+    *,
+    label: str,
+    argv: Sequence[str],
+    url: str,
+    script: Path,
+    binaries: Sequence[Path],
+    contended: bool,
+) -> str | None:
+    """
+    Key a load generator run on the inputs that determine its result.
+
+    The key covers the tool label, the argv (duration, VUs, threads, connections), the script
+    contents, the files under the script's sibling `lib/` and `protos/` directories and the
+    mtimes of the tool and testserver binaries, and whether the run shared the testserver with
+    other load generators (`--parallel-tools` / `--parallel-cases`), so contended results are
+    never replayed into a sequential run. Arguments containing `url` are left out because
+    the testserver binds a random port on every run. Anything else the script reads (other
+    files, environment variables) is not tracked.
+
+    Returns None when an input cannot be read; such runs are never cached.
+    """
+    h = hashlib.blake2b(_CACHE_VERSION, digest_size=20)
+    h.update(label.encode())
+    h.update(b"\0contended" if contended else b"\0exclusive")
+    for arg in argv:
+        if url not in arg:
+            h.update(b"\0" + arg.encode())
+    try:
+        h.update(b"\0" + script.read_bytes())
+        for name in _SCRIPT_SUPPORT_DIRS:
+            support = script.parent / name
+            if not support.is_dir():
+                continue
+            for f in sorted(p for p in support.rglob("*") if p.is_file()):
+                h.update(b"\0" + f.relative_to(script.parent).as_posix().encode())
+                h.update(b"\0" + f.read_bytes())
+        for b in binaries:
+            h.update(b"\0%d" % b.stat().st_mtime_ns)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def load_run(key: str) -> RunResult | None:
+    """Return the cached result for `key`, or None on a miss or an unreadable entry."""
+    try:
+        with (cache_dir() / f"{key}.pkl").open("rb") as f:
+            res = pickle.load(f)
+    except Exception:
+        return None
+    return res if isinstance(res, RunResult) else None
+
+
+def store_run(key: str, res: RunResult) -> None:
+    """Cache a successful run. Best effort: failures to write are ignored."""
+    if res.returncode != 0:
+        return
+    path = cache_dir() / f"{key}.pkl"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with contextlib.suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            pickle.dump(res, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+
+__all__ = [
+    "cache_dir",
+    "load_run",
+    "run_cache_key",
+    "store_run",
+]
@@ -1,33 +1,62 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final
 
-from .config import Config, parse_duration_to_seconds
-from .exec import RunResult, run_with_peak_rss_sampling_streaming
+from wrkr_tools_common.exec import RunResult, run_with_peak_rss_sampling_streaming
+
+from .cache import load_run, run_cache_key, store_run
+from .config import Config, Ratios, RunTuning, parse_duration_to_seconds
 from .parse import (
     ParseError,
     Rps,
-    count_k6_request_failed_warnings,
-    detect_wrk_errors,
-    parse_k6_grpc_req_failed_rate,
-    parse_k6_grpc_rps,
-    parse_k6_http_req_failed_rate,
-    parse_k6_http_rps,
-    parse_wrk_rps,
-    parse_wrkr_rps,
+    WrkrJsonSummary,
+    WrkSignals,
+    k6_rps_parse_error,
+    scan_k6_output,
+    scan_wrk_output,
     try_parse_wrkr_json_summary,
+    wrkr_rps_from_summary,
+)
+from .report import (
+    SummaryLine,
+    SummaryStatus,
+    format_grpc_summary_line,
+    format_http_summary_line,
+    summary_dim,
+    summary_gate_line,
+    summary_gate_skipped,
+    summary_header,
+    summary_tool_line,
 )
-from .report import format_grpc_summary_line, format_http_summary_line
 from .tool_detection import ToolPaths
 from .ui import RunUI
 
+# Every progress record carries one of these keys (v1 / legacy schema); summary records and
+# plain text never do, so they are rejected without paying for a JSON parse.
+_PROGRESS_KEYS: Final[tuple[str, ...]] = ('"elapsedSeconds"', '"elapsed_secs"')
+
+# Progress line layouts (v1 reports seconds as floats, legacy as integer seconds/ms).
+_format_progress_v1: Final = (
+    "wrkr: t={t:>6.2f}s rps_avg={rps:>10.3f} p99={p99:>8.3f}ms "
+    "mean={mean:>8.3f}ms failed_checks={failed} total={total}"
+).format
+_format_progress_legacy: Final = (
+    "wrkr: t={t:>3}s rps_avg={rps:>10.3f} p99={p99:>4}ms "
+    "mean={mean:>7.3f}ms failed_checks={failed} total={total}"
+).format
+
 
 def _format_wrkr_json_progress_line_for_ui(line: str) -> str | None:
     s = line.strip()
-    if not s.startswith("{"):
+    if not s.startswith("{") or not any(k in s for k in _PROGRESS_KEYS):
         return None
     try:
         obj = json.loads(s)
@@ -60,9 +89,8 @@ def _format_wrkr_json_progress_line_for_ui(line: str) -> str | None:
         except Exception:
             return None
 
-        return (
-            f"wrkr: t={t_s:>6.2f}s rps_avg={rps:>10.3f} p99={p99_ms:>8.3f}ms "
-            f"mean={mean_ms:>8.3f}ms failed_checks={failed} total={total}"
+        return _format_progress_v1(
+            t=t_s, rps=rps, p99=p99_ms, mean=mean_ms, failed=failed, total=total
         )
 
     # Legacy NDJSON (pre v1).
@@ -81,10 +109,7 @@ def _format_wrkr_json_progress_line_for_ui(line: str) -> str | None:
     except Exception:
         return None
 
-    return (
-        f"wrkr: t={t:>3}s rps_avg={rps:>10.3f} p99={p99:>4}ms "
-        f"mean={mean:>7.3f}ms failed_checks={failed} total={total}"
-    )
+    return _format_progress_legacy(t=t, rps=rps, p99=p99, mean=mean, failed=failed, total=total)
 
 
 def _fmt_ms_i(v: int | None) -> str:
@@ -103,22 +128,20 @@ def _fmt_int(v: int | None) -> str:
     return "-" if v is None else f"{v}"
 
 
-def _no_proxy_env_for_localhost() -> dict[str, str]:
+@functools.cache
+def _no_proxy_env_for_localhost() -> Mapping[str, str]:
+    # Computed once per process; callers copy it into their own env dicts.
     # Many developer environments set HTTP(S)_PROXY; ensure we never proxy local testserver traffic.
     # Both reqwest (wrkr) and Go net/http (k6) respect NO_PROXY/no_proxy.
-    add = ["127.0.0.1", "localhost", "::1"]
+    add = ("127.0.0.1", "localhost", "::1")
 
     def merge(existing: str | None) -> str:
-        parts: list[str] = []
-        if existing:
-            parts.extend([p.strip() for p in existing.split(",") if p.strip()])
-        for p in add:
-            if p not in parts:
-                parts.append(p)
-        return ",".join(parts)
+        parts = [p.strip() for p in existing.split(",")] if existing else []
+        # dict.fromkeys keeps first-seen order and de-duplicates with O(1) membership.
+        return ",".join(dict.fromkeys(p for p in (*parts, *add) if p))
 
     merged = merge(os.environ.get("NO_PROXY") or os.environ.get("no_proxy"))
-    return {"NO_PROXY": merged, "no_proxy": merged}
+    return MappingProxyType({"NO_PROXY": merged, "no_proxy": merged})
 
 
 class CaseError(RuntimeError):
@@ -153,29 +176,37 @@ class GrpcCase:
     ratio_ok_wrkr_over_k6: float
 
 
+# In both outcome types `failure_messages` and `summary_lines` are typed as Sequence to
+# discourage mutation; they are the lists the case built, not copies.
 @dataclass(frozen=True, slots=True)
 class HttpCaseOutcome:
     failures: int
     wrk_rps: Rps | None
-    failure_messages: tuple[str, ...]
-    summary_lines: tuple[str, ...]
+    failure_messages: Sequence[str]
+    summary_lines: Sequence[SummaryLine]
 
 
 @dataclass(frozen=True, slots=True)
 class GrpcCaseOutcome:
     failures: int
     wrkr_rps: Rps | None
-    failure_messages: tuple[str, ...]
-    summary_lines: tuple[str, ...]
+    failure_messages: Sequence[str]
+    summary_lines: Sequence[SummaryLine]
 
 
-def default_http_cases(cfg: Config) -> list[HttpCase]:
+def default_http_cases(cfg: Config) -> tuple[HttpCase, ...]:
     """
     Default HTTP cases.
 
     The script paths are relative to the wrkr repo root and refer to files under `tools/perf/`.
     """
-    return [
+    return _http_cases_for(cfg.ratios)
+
+
+@functools.lru_cache(maxsize=4)
+def _http_cases_for(ratios: Ratios) -> tuple[HttpCase, ...]:
+    # The cases are a pure function of the ratio gates.
+    return (
         HttpCase(
             title="GET /hello",
             scripts=HttpCaseScripts(
@@ -183,8 +214,8 @@ def default_http_cases(cfg: Config) -> list[HttpCase]:
                 wrkr="tools/perf/wrkr_hello.lua",
                 k6="tools/perf/k6_hello.js",
             ),
-            ratio_ok_wrkr_over_wrk=cfg.ratios.ratio_ok_get_hello,
-            ratio_ok_wrkr_over_k6=cfg.ratios.ratio_ok_wrkr_over_k6,
+            ratio_ok_wrkr_over_wrk=ratios.ratio_ok_get_hello,
+            ratio_ok_wrkr_over_k6=ratios.ratio_ok_wrkr_over_k6,
         ),
         HttpCase(
             title="POST /echo (json + checks)",
@@ -193,8 +224,8 @@ def default_http_cases(cfg: Config) -> list[HttpCase]:
                 wrkr="tools/perf/wrkr_post_json.lua",
                 k6="tools/perf/k6_post_json.js",
             ),
-            ratio_ok_wrkr_over_wrk=cfg.ratios.ratio_ok_post_json,
-            ratio_ok_wrkr_over_k6=cfg.ratios.ratio_ok_wrkr_over_k6,
+            ratio_ok_wrkr_over_wrk=ratios.ratio_ok_post_json,
+            ratio_ok_wrkr_over_k6=ratios.ratio_ok_wrkr_over_k6,
         ),
         HttpCase(
             title="POST /analytics/aggregate (wfb json + checks)",
@@ -203,26 +234,31 @@ def default_http_cases(cfg: Config) -> list[HttpCase]:
                 wrkr="tools/perf/wrkr_wfb_json_aggregate.lua",
                 k6="tools/perf/k6_wfb_json_aggregate.js",
             ),
-            ratio_ok_wrkr_over_wrk=cfg.ratios.ratio_ok_wfb_json_aggregate,
-            ratio_ok_wrkr_over_k6=cfg.ratios.ratio_ok_wrkr_over_k6,
+            ratio_ok_wrkr_over_wrk=ratios.ratio_ok_wfb_json_aggregate,
+            ratio_ok_wrkr_over_k6=ratios.ratio_ok_wrkr_over_k6,
         ),
-    ]
+    )
 
 
-def default_grpc_cases(cfg: Config) -> list[GrpcCase]:
+def default_grpc_cases(cfg: Config) -> tuple[GrpcCase, ...]:
     """
     Default gRPC cases.
 
     The script paths are relative to the wrkr repo root and refer to files under `tools/perf/`.
     """
-    return [
+    return _grpc_cases_for(cfg.ratios)
+
+
+@functools.lru_cache(maxsize=4)
+def _grpc_cases_for(ratios: Ratios) -> tuple[GrpcCase, ...]:
+    return (
         GrpcCase(
             title="gRPC Echo (plaintext)",
             scripts=GrpcCaseScripts(
                 wrkr="tools/perf/wrkr_grpc_plaintext.lua",
                 k6="tools/perf/k6_grpc_plaintext.js",
             ),
-            ratio_ok_wrkr_over_k6=cfg.ratios.ratio_ok_grpc_wrkr_over_k6,
+            ratio_ok_wrkr_over_k6=ratios.ratio_ok_grpc_wrkr_over_k6,
         ),
         GrpcCase(
             title="gRPC AggregateOrders (wfb)",
@@ -230,9 +266,9 @@ def default_grpc_cases(cfg: Config) -> list[GrpcCase]:
                 wrkr="tools/perf/wfb_grpc_aggregate.lua",
                 k6="tools/perf/k6_wfb_grpc_aggregate.js",
             ),
-            ratio_ok_wrkr_over_k6=cfg.ratios.ratio_ok_wfb_grpc_aggregate_wrkr_over_k6,
+            ratio_ok_wrkr_over_k6=ratios.ratio_ok_wfb_grpc_aggregate_wrkr_over_k6,
         ),
-    ]
+    )
 
 
 def run_http_case(
@@ -249,29 +285,40 @@ def run_http_case(
 
     failures = 0
     failure_messages: list[str] = []
-    summary_lines: list[str] = []
 
-    wrk_res: RunResult | None
-    wrk_ok = True
+    wrkr_env = {"BASE_URL": base_url, **_no_proxy_env_for_localhost()}
+
+    wrk_run: _ToolRun | None = None
     if tools.wrk is not None:
-        wrk_argv = [
-            str(tools.wrk),
-            f"-t{cfg.tuning.wrk_threads}",
-            f"-c{cfg.tuning.wrk_connections}",
-            f"-d{cfg.tuning.duration}",
-            "-s",
-            str(cfg.root / scripts.wrk),
-            base_url,
-        ]
-        with ui.step(f"{title}: wrk"):
-            ui.set_current_command(label="wrk", argv=wrk_argv, cwd=cfg.root, env=None)
-            wrk_res = run_with_peak_rss_sampling_streaming(
-                wrk_argv,
-                cwd=cfg.root,
-                on_stdout_line=ui.tail,
-                on_stderr_line=lambda line: ui.tail(line, style="dim"),
-            )
+        wrk_script = _script_path(cfg.root, scripts.wrk)
+        wrk_run = _ToolRun(
+            label="wrk",
+            argv=(*_wrk_argv_prefix(tools.wrk, cfg.tuning, wrk_script), base_url),
+            env=None,
+            on_stdout_line=ui.tail,
+            script=wrk_script,
+            url=base_url,
+        )
+    else:
+        ui.log("wrk: skipped (not installed)")
+
+    wrkr_run = _wrkr_run(
+        cfg=cfg, tools=tools, script=scripts.wrkr, url=base_url, env=wrkr_env, ui=ui
+    )
+
+    k6_run: _ToolRun | None = None
+    if tools.k6 is not None:
+        k6_run = _k6_run(cfg=cfg, k6=tools.k6, script=scripts.k6, env=wrkr_env, ui=ui)
+    else:
+        ui.log("k6: skipped (not installed)")
+
+    wrk_res, wrkr_res, k6_res = _run_tools(
+        (wrk_run, wrkr_run, k6_run), cfg=cfg, tools=tools, title=title, ui=ui
+    )
 
+    wrk_ok = wrk_res is not None
+    wrk_signals: WrkSignals | None = None
+    if wrk_res is not None:
         if wrk_res.returncode != 0:
             wrk_ok = False
             msg = f"FAIL: wrk exited with code {wrk_res.returncode}"
@@ -279,45 +326,15 @@ def run_http_case(
             failure_messages.append(msg)
             failures += 1
         else:
-            wrk_errs = detect_wrk_errors(wrk_res.stdout)
-            if wrk_errs:
+            wrk_signals = scan_wrk_output(wrk_res.stdout)
+            if wrk_signals.errors:
                 wrk_ok = False
-                for e in wrk_errs:
-                    msg = f"FAIL: {e}"
-                    ui.log(msg, style="red")
-                    failure_messages.append(msg)
-                    failures += 1
-    else:
-        ui.log("wrk: skipped (not installed)")
-        wrk_res = None
-        wrk_ok = False
-
-    ui.log("wrkr")
-    wrkr_env = {"BASE_URL": base_url, **_no_proxy_env_for_localhost()}
-    wrkr_argv = [
-        str(tools.wrkr),
-        "run",
-        scripts.wrkr,
-        "--output",
-        "json",
-        "--duration",
-        cfg.tuning.duration,
-        "--vus",
-        str(cfg.tuning.wrkr_vus),
-        "--env",
-        f"BASE_URL={base_url}",
-    ]
-    with ui.step(f"{title}: wrkr"):
-        ui.set_current_command(label="wrkr", argv=wrkr_argv, cwd=cfg.root, env=wrkr_env)
-        wrkr_res = run_with_peak_rss_sampling_streaming(
-            wrkr_argv,
-            cwd=cfg.root,
-            env=wrkr_env,
-            on_stdout_line=lambda line: ui.tail(
-                _format_wrkr_json_progress_line_for_ui(line) or line
-            ),
-            on_stderr_line=lambda line: ui.tail(line, style="dim"),
-        )
+                with ui.batched_log() as log:
+                    for e in wrk_signals.errors:
+                        msg = f"FAIL: {e}"
+                        log(msg, style="red")
+                        failure_messages.append(msg)
+                        failures += 1
 
     wrkr_ok = True
     if wrkr_res.returncode != 0:
@@ -327,55 +344,34 @@ def run_http_case(
         failure_messages.append(msg)
         failures += 1
 
-    k6_res: RunResult | None
-    k6_ok = True
-    if tools.k6 is not None:
-        k6_argv = [
-            str(tools.k6),
-            "run",
-            "--vus",
-            str(cfg.effective_k6_vus()),
-            "--duration",
-            cfg.tuning.duration,
-            str(cfg.root / scripts.k6),
-        ]
-        with ui.step(f"{title}: k6"):
-            ui.set_current_command(label="k6", argv=k6_argv, cwd=cfg.root, env=wrkr_env)
-            k6_res = run_with_peak_rss_sampling_streaming(
-                k6_argv,
-                cwd=cfg.root,
-                env=wrkr_env,
-                on_stdout_line=ui.tail,
-                on_stderr_line=lambda line: ui.tail(line, style="dim"),
-            )
-
-        if k6_res.returncode != 0:
-            k6_ok = False
-            msg = f"FAIL: k6 exited with code {k6_res.returncode}"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-    else:
-        ui.log("k6: skipped (not installed)")
-        k6_res = None
+    k6_ok = k6_res is not None
+    if k6_res is not None and k6_res.returncode != 0:
         k6_ok = False
-
-    wrkr_rps: Rps | None
-    wrkr_json = try_parse_wrkr_json_summary(stdout=wrkr_res.stdout, stderr=wrkr_res.stderr)
-    try:
-        wrkr_rps = parse_wrkr_rps(
-            stdout=wrkr_res.stdout,
-            stderr=wrkr_res.stderr,
-            test_duration_seconds=parse_duration_to_seconds(cfg.tuning.duration),
-        )
-    except ParseError as e:
-        wrkr_rps = None
-        wrkr_ok = False
-        msg = f"FAIL: could not parse wrkr RPS ({e})"
+        msg = f"FAIL: k6 exited with code {k6_res.returncode}"
         ui.log(msg, style="red")
         failure_messages.append(msg)
         failures += 1
 
+    # The JSON summary is parsed even after a non-zero exit: checks/threshold failures exit
+    # non-zero but still report latencies and the failed check count. Without it, a failed run
+    # has no RPS worth scanning the text output for.
+    wrkr_rps: Rps | None = None
+    wrkr_json = try_parse_wrkr_json_summary(stdout=wrkr_res.stdout, stderr=wrkr_res.stderr)
+    if wrkr_json is not None or wrkr_res.returncode == 0:
+        try:
+            wrkr_rps = wrkr_rps_from_summary(
+                wrkr_json,
+                stdout=wrkr_res.stdout,
+                stderr=wrkr_res.stderr,
+                test_duration_seconds=parse_duration_to_seconds(cfg.tuning.duration),
+            )
+        except ParseError as e:
+            wrkr_ok = False
+            msg = f"FAIL: could not parse wrkr RPS ({e})"
+            ui.log(msg, style="red")
+            failure_messages.append(msg)
+            failures += 1
+
     if wrkr_json is not None and wrkr_json.checks_failed_total > 0:
         wrkr_ok = False
         msg = f"FAIL: wrkr has failed checks (count={wrkr_json.checks_failed_total})"
@@ -384,44 +380,44 @@ def run_http_case(
         failures += 1
 
     wrk_rps: Rps | None = None
-    if wrk_res is not None:
-        try:
-            wrk_rps = parse_wrk_rps(wrk_res.stdout)
-        except ParseError as e:
-            wrk_rps = None
+    if wrk_signals is not None:
+        wrk_rps = wrk_signals.rps
+        if wrk_rps is None:
             wrk_ok = False
-            msg = f"FAIL: could not parse wrk RPS ({e})"
+            msg = f"FAIL: could not parse wrk RPS ({wrk_signals.rps_error})"
             ui.log(msg, style="red")
             failure_messages.append(msg)
             failures += 1
 
+    # A k6 run that already failed has been counted; its output is not scanned for more.
     k6_rps: Rps | None = None
-    if k6_res is not None:
-        try:
-            k6_rps = parse_k6_http_rps(stdout=k6_res.stdout, stderr=k6_res.stderr)
-        except ParseError as e:
-            k6_rps = None
-            k6_ok = False
-            msg = f"FAIL: could not parse k6 RPS ({e})"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-
-        k6_failed = parse_k6_http_req_failed_rate(stdout=k6_res.stdout, stderr=k6_res.stderr)
-        if k6_failed is not None and k6_failed > 0.0:
-            k6_ok = False
-            msg = f"FAIL: k6 has request failures (http_req_failed={k6_failed:.3%})"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-
-        warn_n = count_k6_request_failed_warnings(stdout=k6_res.stdout, stderr=k6_res.stderr)
-        if warn_n > 0:
-            k6_ok = False
-            msg = f"FAIL: k6 emitted Request Failed warnings (count={warn_n})"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
+    if k6_res is not None and k6_res.returncode == 0:
+        k6_signals = scan_k6_output(stdout=k6_res.stdout, stderr=k6_res.stderr)
+        with ui.batched_log() as log:
+            k6_rps = k6_signals.http_rps
+            if k6_rps is None:
+                k6_ok = False
+                e = k6_rps_parse_error(stdout=k6_res.stdout, stderr=k6_res.stderr)
+                msg = f"FAIL: could not parse k6 RPS ({e})"
+                log(msg, style="red")
+                failure_messages.append(msg)
+                failures += 1
+
+            k6_failed = k6_signals.http_req_failed
+            if k6_failed is not None and k6_failed > 0.0:
+                k6_ok = False
+                msg = f"FAIL: k6 has request failures (http_req_failed={k6_failed:.3%})"
+                log(msg, style="red")
+                failure_messages.append(msg)
+                failures += 1
+
+            warn_n = k6_signals.request_failed_warnings
+            if warn_n > 0:
+                k6_ok = False
+                msg = f"FAIL: k6 emitted Request Failed warnings (count={warn_n})"
+                log(msg, style="red")
+                failure_messages.append(msg)
+                failures += 1
 
     ui.log(
         format_http_summary_line(
@@ -434,88 +430,57 @@ def run_http_case(
         )
     )
 
-    summary_lines.append(f"HTTP {title}")
-    summary_lines.append(
-        f"  scripts: wrk={scripts.wrk} wrkr={scripts.wrkr} k6={scripts.k6} duration={cfg.tuning.duration}"
+    summary_lines = _tool_summary_lines(
+        header=f"HTTP {title}",
+        scripts=f"wrk={scripts.wrk} wrkr={scripts.wrkr} k6={scripts.k6}",
+        duration=cfg.tuning.duration,
+        wrk=(_tool_status(tools.wrk, wrk_ok), wrk_rps),
+        wrkr=(_tool_status(tools.wrkr, wrkr_ok), wrkr_rps),
+        wrkr_json=wrkr_json,
+        k6=(_tool_status(tools.k6, k6_ok), k6_rps),
     )
-    summary_lines.append(
-        f"  wrk : {'OK' if (tools.wrk is not None and wrk_ok) else ('SKIP' if tools.wrk is None else 'FAIL')} rps={wrk_rps.value:.3f}"
-        if wrk_rps is not None
-        else f"  wrk : {'OK' if (tools.wrk is not None and wrk_ok) else ('SKIP' if tools.wrk is None else 'FAIL')} rps=-"
-    )
-    summary_lines.append(
-        f"  wrkr: {'OK' if wrkr_ok else 'FAIL'} rps={wrkr_rps.value:.3f}"
-        if wrkr_rps is not None
-        else f"  wrkr: {'OK' if wrkr_ok else 'FAIL'} rps=-"
-    )
-    if wrkr_json is not None:
-        summary_lines.append(
-            "  wrkr json: "
-            f"p50={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_p50_seconds))}ms p90={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_p90_seconds))}ms "
-            f"p99={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_p99_seconds))}ms max={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_max_seconds))}ms "
-            f"mean={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_mean_seconds))}ms failed_checks={wrkr_json.checks_failed_total} "
-            f"rx/s={_fmt_int(wrkr_json.bytes_received_per_sec)} tx/s={_fmt_int(wrkr_json.bytes_sent_per_sec)}"
-        )
-    if tools.k6 is None:
-        summary_lines.append("  k6  : SKIP")
-    else:
-        summary_lines.append(
-            f"  k6  : {'OK' if k6_ok else 'FAIL'} rps={k6_rps.value:.3f}"
-            if k6_rps is not None
-            else f"  k6  : {'OK' if k6_ok else 'FAIL'} rps=-"
-        )
 
     # Gate: wrkr vs wrk (inclusive)
     if wrk_rps is not None and wrkr_rps is not None and wrk_ok and wrkr_ok:
-        ratio_actual = wrkr_rps.value / wrk_rps.value if wrk_rps.value > 0 else float("inf")
-        if is_too_slow(
-            wrkr=wrkr_rps, other=wrk_rps, ratio=case.ratio_ok_wrkr_over_wrk, inclusive=True
-        ):
-            msg = (
-                "FAIL: wrkr is too slow vs wrk "
-                f"(ratio_ok={case.ratio_ok_wrkr_over_wrk}, ratio_actual={ratio_actual:.3f})"
-            )
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-        else:
-            msg = (
-                f"PASS: wrkr/wrk >= {case.ratio_ok_wrkr_over_wrk} (ratio_actual={ratio_actual:.3f})"
-            )
-            ui.log(msg)
-        summary_lines.append(
-            f"  gate wrkr/wrk: ratio_ok={case.ratio_ok_wrkr_over_wrk} ratio_actual={ratio_actual:.3f}"
+        gate_line, gate_failure = _gate(
+            "wrk",
+            case=f"HTTP {title}",
+            wrkr=wrkr_rps,
+            other=wrk_rps,
+            ratio=case.ratio_ok_wrkr_over_wrk,
+            inclusive=True,
+            ui=ui,
         )
+        summary_lines.append(gate_line)
+        if gate_failure is not None:
+            failure_messages.append(gate_failure)
+            failures += 1
     else:
-        summary_lines.append("  gate wrkr/wrk: SKIP (correctness failed or missing tool)")
+        summary_lines.append(summary_gate_skipped("wrkr/wrk"))
 
     # Gate: wrkr vs k6 (strict)
     if k6_rps is not None and wrkr_rps is not None and k6_ok and wrkr_ok:
-        ratio_actual = wrkr_rps.value / k6_rps.value if k6_rps.value > 0 else float("inf")
-        if is_too_slow(
-            wrkr=wrkr_rps, other=k6_rps, ratio=case.ratio_ok_wrkr_over_k6, inclusive=False
-        ):
-            msg = (
-                "FAIL: wrkr is too slow vs k6 "
-                f"(ratio_ok={case.ratio_ok_wrkr_over_k6}, ratio_actual={ratio_actual:.3f})"
-            )
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-        else:
-            msg = f"PASS: wrkr/k6 > {case.ratio_ok_wrkr_over_k6} (ratio_actual={ratio_actual:.3f})"
-            ui.log(msg)
-        summary_lines.append(
-            f"  gate wrkr/k6 : ratio_ok={case.ratio_ok_wrkr_over_k6} ratio_actual={ratio_actual:.3f}"
+        gate_line, gate_failure = _gate(
+            "k6",
+            case=f"HTTP {title}",
+            wrkr=wrkr_rps,
+            other=k6_rps,
+            ratio=case.ratio_ok_wrkr_over_k6,
+            inclusive=False,
+            ui=ui,
         )
+        summary_lines.append(gate_line)
+        if gate_failure is not None:
+            failure_messages.append(gate_failure)
+            failures += 1
     else:
-        summary_lines.append("  gate wrkr/k6 : SKIP (correctness failed or missing tool)")
+        summary_lines.append(summary_gate_skipped("wrkr/k6 "))
 
     return HttpCaseOutcome(
         failures=failures,
         wrk_rps=wrk_rps,
-        failure_messages=tuple(failure_messages),
-        summary_lines=tuple(summary_lines),
+        failure_messages=failure_messages,
+        summary_lines=summary_lines,
     )
 
 
@@ -537,34 +502,19 @@ def run_grpc_case(
 
     failures = 0
     failure_messages: list[str] = []
-    summary_lines: list[str] = []
 
-    ui.log("wrkr")
     wrkr_env = {"BASE_URL": grpc_url, **_no_proxy_env_for_localhost()}
-    wrkr_argv = [
-        str(tools.wrkr),
-        "run",
-        scripts.wrkr,
-        "--output",
-        "json",
-        "--duration",
-        cfg.tuning.duration,
-        "--vus",
-        str(cfg.tuning.wrkr_vus),
-        "--env",
-        f"BASE_URL={grpc_url}",
-    ]
-    with ui.step(f"{title}: wrkr"):
-        ui.set_current_command(label="wrkr", argv=wrkr_argv, cwd=cfg.root, env=wrkr_env)
-        wrkr_res = run_with_peak_rss_sampling_streaming(
-            wrkr_argv,
-            cwd=cfg.root,
-            env=wrkr_env,
-            on_stdout_line=lambda line: ui.tail(
-                _format_wrkr_json_progress_line_for_ui(line) or line
-            ),
-            on_stderr_line=lambda line: ui.tail(line, style="dim"),
-        )
+    wrkr_run = _wrkr_run(
+        cfg=cfg, tools=tools, script=scripts.wrkr, url=grpc_url, env=wrkr_env, ui=ui
+    )
+
+    k6_run: _ToolRun | None = None
+    if tools.k6 is not None:
+        k6_run = _k6_run(cfg=cfg, k6=tools.k6, script=scripts.k6, env=wrkr_env, ui=ui)
+    else:
+        ui.log("k6: skipped (not installed)")
+
+    wrkr_res, k6_res = _run_tools((wrkr_run, k6_run), cfg=cfg, tools=tools, title=title, ui=ui)
 
     wrkr_ok = True
     if wrkr_res.returncode != 0:
@@ -574,21 +524,25 @@ def run_grpc_case(
         failure_messages.append(msg)
         failures += 1
 
-    wrkr_rps: Rps | None
+    # The JSON summary is parsed even after a non-zero exit: checks/threshold failures exit
+    # non-zero but still report latencies and the failed check count. Without it, a failed run
+    # has no RPS worth scanning the text output for.
+    wrkr_rps: Rps | None = None
     wrkr_json = try_parse_wrkr_json_summary(stdout=wrkr_res.stdout, stderr=wrkr_res.stderr)
-    try:
-        wrkr_rps = parse_wrkr_rps(
-            stdout=wrkr_res.stdout,
-            stderr=wrkr_res.stderr,
-            test_duration_seconds=parse_duration_to_seconds(cfg.tuning.duration),
-        )
-    except ParseError as e:
-        wrkr_rps = None
-        wrkr_ok = False
-        msg = f"FAIL: could not parse wrkr RPS ({e})"
-        ui.log(msg, style="red")
-        failure_messages.append(msg)
-        failures += 1
+    if wrkr_json is not None or wrkr_res.returncode == 0:
+        try:
+            wrkr_rps = wrkr_rps_from_summary(
+                wrkr_json,
+                stdout=wrkr_res.stdout,
+                stderr=wrkr_res.stderr,
+                test_duration_seconds=parse_duration_to_seconds(cfg.tuning.duration),
+            )
+        except ParseError as e:
+            wrkr_ok = False
+            msg = f"FAIL: could not parse wrkr RPS ({e})"
+            ui.log(msg, style="red")
+            failure_messages.append(msg)
+            failures += 1
 
     if wrkr_json is not None and wrkr_json.checks_failed_total > 0:
         wrkr_ok = False
@@ -597,66 +551,43 @@ def run_grpc_case(
         failure_messages.append(msg)
         failures += 1
 
-    k6_res: RunResult | None
-    k6_ok = True
-    if tools.k6 is not None:
-        k6_argv = [
-            str(tools.k6),
-            "run",
-            "--vus",
-            str(cfg.effective_k6_vus()),
-            "--duration",
-            cfg.tuning.duration,
-            str(cfg.root / scripts.k6),
-        ]
-        with ui.step(f"{title}: k6"):
-            ui.set_current_command(label="k6", argv=k6_argv, cwd=cfg.root, env=wrkr_env)
-            k6_res = run_with_peak_rss_sampling_streaming(
-                k6_argv,
-                cwd=cfg.root,
-                env=wrkr_env,
-                on_stdout_line=ui.tail,
-                on_stderr_line=lambda line: ui.tail(line, style="dim"),
-            )
-
-        if k6_res.returncode != 0:
-            k6_ok = False
-            msg = f"FAIL: k6 exited with code {k6_res.returncode}"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-    else:
-        ui.log("k6: skipped (not installed)")
-        k6_res = None
+    k6_ok = k6_res is not None
+    if k6_res is not None and k6_res.returncode != 0:
         k6_ok = False
+        msg = f"FAIL: k6 exited with code {k6_res.returncode}"
+        ui.log(msg, style="red")
+        failure_messages.append(msg)
+        failures += 1
 
+    # A k6 run that already failed has been counted; its output is not scanned for more.
     k6_rps: Rps | None = None
-    if k6_res is not None:
-        try:
-            k6_rps = parse_k6_grpc_rps(stdout=k6_res.stdout, stderr=k6_res.stderr)
-        except ParseError as e:
-            k6_rps = None
-            k6_ok = False
-            msg = f"FAIL: could not parse k6 RPS ({e})"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-
-        k6_failed = parse_k6_grpc_req_failed_rate(stdout=k6_res.stdout, stderr=k6_res.stderr)
-        if k6_failed is not None and k6_failed > 0.0:
-            k6_ok = False
-            msg = f"FAIL: k6 has request failures (grpc_req_failed={k6_failed:.3%})"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
-
-        warn_n = count_k6_request_failed_warnings(stdout=k6_res.stdout, stderr=k6_res.stderr)
-        if warn_n > 0:
-            k6_ok = False
-            msg = f"FAIL: k6 emitted Request Failed warnings (count={warn_n})"
-            ui.log(msg, style="red")
-            failure_messages.append(msg)
-            failures += 1
+    if k6_res is not None and k6_res.returncode == 0:
+        k6_signals = scan_k6_output(stdout=k6_res.stdout, stderr=k6_res.stderr)
+        with ui.batched_log() as log:
+            k6_rps = k6_signals.grpc_rps
+            if k6_rps is None:
+                k6_ok = False
+                e = k6_rps_parse_error(stdout=k6_res.stdout, stderr=k6_res.stderr)
+                msg = f"FAIL: could not parse k6 RPS ({e})"
+                log(msg, style="red")
+                failure_messages.append(msg)
+                failures += 1
+
+            k6_failed = k6_signals.grpc_req_failed
+            if k6_failed is not None and k6_failed > 0.0:
+                k6_ok = False
+                msg = f"FAIL: k6 has request failures (grpc_req_failed={k6_failed:.3%})"
+                log(msg, style="red")
+                failure_messages.append(msg)
+                failures += 1
+
+            warn_n = k6_signals.request_failed_warnings
+            if warn_n > 0:
+                k6_ok = False
+                msg = f"FAIL: k6 emitted Request Failed warnings (count={warn_n})"
+                log(msg, style="red")
+                failure_messages.append(msg)
+                failures += 1
 
     ui.log(
         format_grpc_summary_line(
@@ -667,62 +598,257 @@ def run_grpc_case(
         )
     )
 
-    summary_lines.append(f"gRPC {title}")
-    summary_lines.append(
-        f"  scripts: wrkr={scripts.wrkr} k6={scripts.k6} duration={cfg.tuning.duration}"
+    summary_lines = _tool_summary_lines(
+        header=f"gRPC {title}",
+        scripts=f"wrkr={scripts.wrkr} k6={scripts.k6}",
+        duration=cfg.tuning.duration,
+        wrk=None,
+        wrkr=(_tool_status(tools.wrkr, wrkr_ok), wrkr_rps),
+        wrkr_json=wrkr_json,
+        k6=(_tool_status(tools.k6, k6_ok), k6_rps),
     )
-    summary_lines.append(
-        f"  wrkr: {'OK' if wrkr_ok else 'FAIL'} rps={wrkr_rps.value:.3f}"
-        if wrkr_rps is not None
-        else f"  wrkr: {'OK' if wrkr_ok else 'FAIL'} rps=-"
-    )
-    if wrkr_json is not None:
-        summary_lines.append(
-            "  wrkr json: "
-            f"p50={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_p50_seconds))}ms p90={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_p90_seconds))}ms "
-            f"p99={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_p99_seconds))}ms max={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_max_seconds))}ms "
-            f"mean={_fmt_ms_f(_sec_to_ms(wrkr_json.latency_mean_seconds))}ms failed_checks={wrkr_json.checks_failed_total} "
-            f"rx/s={_fmt_int(wrkr_json.bytes_received_per_sec)} tx/s={_fmt_int(wrkr_json.bytes_sent_per_sec)}"
-        )
-    if tools.k6 is None:
-        summary_lines.append("  k6  : SKIP")
-    else:
-        summary_lines.append(
-            f"  k6  : {'OK' if k6_ok else 'FAIL'} rps={k6_rps.value:.3f}"
-            if k6_rps is not None
-            else f"  k6  : {'OK' if k6_ok else 'FAIL'} rps=-"
-        )
 
     # Gate: wrkr vs k6 (strict)
     if k6_rps is not None and wrkr_rps is not None and k6_ok and wrkr_ok:
-        ratio_actual = wrkr_rps.value / k6_rps.value if k6_rps.value > 0 else float("inf")
-        if is_too_slow(
-            wrkr=wrkr_rps, other=k6_rps, ratio=case.ratio_ok_wrkr_over_k6, inclusive=False
-        ):
-            msg = (
-                "FAIL: wrkr is too slow vs k6 "
-                f"(ratio_ok={case.ratio_ok_wrkr_over_k6}, ratio_actual={ratio_actual:.3f})"
-            )
-            ui.log(msg)
-            failure_messages.append(msg)
-            failures += 1
-        else:
-            msg = f"PASS: wrkr/k6 > {case.ratio_ok_wrkr_over_k6} (ratio_actual={ratio_actual:.3f})"
-            ui.log(msg)
-        summary_lines.append(
-            f"  gate wrkr/k6 : ratio_ok={case.ratio_ok_wrkr_over_k6} ratio_actual={ratio_actual:.3f}"
+        gate_line, gate_failure = _gate(
+            "k6",
+            case=f"gRPC {title}",
+            wrkr=wrkr_rps,
+            other=k6_rps,
+            ratio=case.ratio_ok_wrkr_over_k6,
+            inclusive=False,
+            ui=ui,
         )
+        summary_lines.append(gate_line)
+        if gate_failure is not None:
+            failure_messages.append(gate_failure)
+            failures += 1
     else:
-        summary_lines.append("  gate wrkr/k6 : SKIP (correctness failed or missing tool)")
+        summary_lines.append(summary_gate_skipped("wrkr/k6 "))
 
     return GrpcCaseOutcome(
         failures=failures,
         wrkr_rps=wrkr_rps,
-        failure_messages=tuple(failure_messages),
-        summary_lines=tuple(summary_lines),
+        failure_messages=failure_messages,
+        summary_lines=summary_lines,
     )
 
 
+def _tool_status(path: Path | None, ok: bool) -> SummaryStatus:
+    if path is None:
+        return "SKIP"
+    return "OK" if ok else "FAIL"
+
+
+def _wrkr_json_summary_line(js: WrkrJsonSummary) -> SummaryLine:
+    p50 = _fmt_ms_f(_sec_to_ms(js.latency_p50_seconds))
+    p90 = _fmt_ms_f(_sec_to_ms(js.latency_p90_seconds))
+    p99 = _fmt_ms_f(_sec_to_ms(js.latency_p99_seconds))
+    max_ = _fmt_ms_f(_sec_to_ms(js.latency_max_seconds))
+    mean = _fmt_ms_f(_sec_to_ms(js.latency_mean_seconds))
+    rx = _fmt_int(js.bytes_received_per_sec)
+    tx = _fmt_int(js.bytes_sent_per_sec)
+    return SummaryLine(
+        f"  wrkr json: p50={p50}ms p90={p90}ms p99={p99}ms max={max_}ms mean={mean}ms "
+        f"failed_checks={js.checks_failed_total} rx/s={rx} tx/s={tx}"
+    )
+
+
+def _tool_summary_lines(
+    *,
+    header: str,
+    scripts: str,
+    duration: str,
+    wrk: tuple[SummaryStatus, Rps | None] | None,
+    wrkr: tuple[SummaryStatus, Rps | None],
+    wrkr_json: WrkrJsonSummary | None,
+    k6: tuple[SummaryStatus, Rps | None],
+) -> list[SummaryLine]:
+    """
+    Build the per-tool part of a case summary (header, scripts, one line per tool).
+
+    `wrk=None` omits the wrk line entirely (gRPC cases). The caller appends the gate lines.
+    """
+    lines = [summary_header(header), summary_dim(f"  scripts: {scripts} duration={duration}")]
+    if wrk is not None:
+        lines.append(summary_tool_line("wrk ", *wrk))
+    lines.append(summary_tool_line("wrkr", *wrkr))
+    if wrkr_json is not None:
+        lines.append(_wrkr_json_summary_line(wrkr_json))
+    k6_status, k6_rps = k6
+    lines.append(summary_tool_line("k6  ", k6_status, k6_rps, with_rps=k6_status != "SKIP"))
+    return lines
+
+
+@dataclass(frozen=True, slots=True)
+class _ToolRun:
+    """One load generator invocation within a case."""
+
+    label: str
+    argv: tuple[str, ...]
+    env: dict[str, str] | None
+    on_stdout_line: Callable[[str], None]
+    # Inputs for the result cache (see `cache.run_cache_key`).
+    script: Path
+    url: str
+
+
+def _wrkr_run(
+    *, cfg: Config, tools: ToolPaths, script: str, url: str, env: dict[str, str], ui: RunUI
+) -> _ToolRun:
+    return _ToolRun(
+        label="wrkr",
+        argv=(*_wrkr_argv_prefix(tools.wrkr, cfg.tuning, script), f"BASE_URL={url}"),
+        env=env,
+        on_stdout_line=lambda line: ui.tail(_format_wrkr_json_progress_line_for_ui(line) or line),
+        script=_script_path(cfg.root, script),
+        url=url,
+    )
+
+
+def _k6_run(*, cfg: Config, k6: Path, script: str, env: dict[str, str], ui: RunUI) -> _ToolRun:
+    script_path = _script_path(cfg.root, script)
+    return _ToolRun(
+        label="k6",
+        argv=_k6_argv(k6, cfg.effective_k6_vus(), cfg.tuning.duration, script_path),
+        env=env,
+        on_stdout_line=ui.tail,
+        script=script_path,
+        url=env["BASE_URL"],
+    )
+
+
+# The argv builders below only see config-time inputs (binary, tuning, script), so they are
+# memoized and every case after the first reuses the same strings. The per-run target URL is
+# appended by the caller.
+
+
+@functools.lru_cache(maxsize=64)
+def _script_path(root: Path, rel_path: str) -> Path:
+    return root / rel_path
+
+
+@functools.lru_cache(maxsize=64)
+def _wrk_argv_prefix(wrk: Path, tuning: RunTuning, script: Path) -> tuple[str, ...]:
+    return (
+        str(wrk),
+        f"-t{tuning.wrk_threads}",
+        f"-c{tuning.wrk_connections}",
+        f"-d{tuning.duration}",
+        "-s",
+        str(script),
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _wrkr_argv_prefix(wrkr: Path, tuning: RunTuning, script: str) -> tuple[str, ...]:
+    return (
+        str(wrkr),
+        "run",
+        script,
+        "--output",
+        "json",
+        "--duration",
+        tuning.duration,
+        "--vus",
+        str(tuning.wrkr_vus),
+        "--env",
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _k6_argv(k6: Path, vus: int, duration: str, script: Path) -> tuple[str, ...]:
+    return (str(k6), "run", "--vus", str(vus), "--duration", duration, str(script))
+
+
+def _run_tools(
+    runs: Sequence[_ToolRun | None], *, cfg: Config, tools: ToolPaths, title: str, ui: RunUI
+) -> list[RunResult | None]:
+    """
+    Run a case's load generators and return their results in `runs` order.
+
+    `None` entries (tool not installed) yield `None`. Tools run one after another unless
+    `parallel_tools` is enabled, in which case they all hit the testserver at once: much
+    faster, but the measured rates are no longer comparable, so leave it off when gating.
+
+    With `use_cache`, successful runs are stored on disk and replayed while the script,
+    arguments, binaries and parallel mode are unchanged.
+    """
+
+    def run_one(run: _ToolRun | None) -> RunResult | None:
+        if run is None:
+            return None
+
+        key = None
+        if cfg.tuning.use_cache:
+            key = run_cache_key(
+                label=run.label,
+                argv=run.argv,
+                url=run.url,
+                script=run.script,
+                binaries=(Path(run.argv[0]), tools.wrkr_testserver),
+                contended=cfg.tuning.parallel_tools or cfg.tuning.parallel_cases > 1,
+            )
+        cached = load_run(key) if key is not None else None
+        if cached is not None:
+            with ui.step(f"{title}: {run.label} (cached)"):
+                ui.log(f"{run.label}: reusing cached result")
+            return cached
+
+        with ui.step(f"{title}: {run.label}"):
+            ui.set_current_command(label=run.label, argv=run.argv, cwd=cfg.root, env=run.env)
+            res = run_with_peak_rss_sampling_streaming(
+                run.argv,
+                cwd=cfg.root,
+                env=run.env,
+                on_stdout_line=run.on_stdout_line,
+                on_stderr_line=lambda line: ui.tail(line, style="dim"),
+            )
+        if key is not None:
+            store_run(key, res)
+        return res
+
+    if not cfg.tuning.parallel_tools:
+        return [run_one(r) for r in runs]
+
+    with ThreadPoolExecutor(max_workers=len(runs), thread_name_prefix="tool") as pool:
+        return list(pool.map(run_one, runs))
+
+
+def _gate(
+    other_name: str,
+    *,
+    case: str,
+    wrkr: Rps,
+    other: Rps,
+    ratio: float,
+    inclusive: bool,
+    ui: RunUI,
+) -> tuple[SummaryLine, str | None]:
+    """
+    Evaluate one ratio gate, log PASS/FAIL and return its summary line.
+
+    Log lines are prefixed with `case` so they stay attributable when cases run concurrently.
+    The second element is the failure message (without the prefix), or None when the gate
+    passed.
+    """
+    ratio_actual = wrkr.value / other.value if other.value > 0 else float("inf")
+    line = summary_gate_line(
+        f"wrkr/{other_name}".ljust(8), ratio_ok=ratio, ratio_actual=ratio_actual
+    )
+    if is_too_slow(wrkr=wrkr, other=other, ratio=ratio, inclusive=inclusive):
+        msg = (
+            f"FAIL: wrkr is too slow vs {other_name} "
+            f"(ratio_ok={ratio}, ratio_actual={ratio_actual:.3f})"
+        )
+        ui.log(f"{case}: {msg}", style="red")
+        return line, msg
+
+    op = ">=" if inclusive else ">"
+    ui.log(f"{case}: PASS: wrkr/{other_name} {op} {ratio} (ratio_actual={ratio_actual:.3f})")
+    return line, None
+
+
 def is_too_slow(*, wrkr: Rps, other: Rps, ratio: float, inclusive: bool) -> bool:
     """
     Gate predicate (matches the previous tool behavior).
@@ -737,11 +863,13 @@ def is_too_slow(*, wrkr: Rps, other: Rps, ratio: float, inclusive: bool) -> bool
     return wrkr.value <= (other.value * ratio)
 
 
+@functools.lru_cache(maxsize=64)
 def _ensure_script_exists(root: Path, rel_path: str) -> None:
     """
     Ensure a script file exists relative to repo root.
 
-    We validate early to avoid confusing tool failures later.
+    We validate early to avoid confusing tool failures later. Successful checks are
+    memoized (a missing script raises, which is never cached).
     """
     p = (root / rel_path).resolve()
     if not p.exists():
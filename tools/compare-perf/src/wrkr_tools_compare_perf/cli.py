@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-import os
+import functools
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any, Final
 
 import typer
 
-from .app import config_from_values
-from .app import run as run_suite
-from .config import ConfigError, env_path
+from . import __version__
+from .config import ConfigError, Ratios, env_path, parse_color_mode
+
+# Names this module used to import eagerly from `.app`. They stay importable
+# (`from wrkr_tools_compare_perf.cli import run_suite`) but only load the runner on first access.
+_LAZY_APP_ATTRS: Final[dict[str, str]] = {
+    "config_from_values": "config_from_values",
+    "run_suite": "run",
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: only consulted for attributes not found in the module namespace.
+    try:
+        target = _LAZY_APP_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from . import app as _app
+
+    return getattr(_app, target)
+
 
 app = typer.Typer(
     add_completion=False,
@@ -18,36 +36,10 @@ app = typer.Typer(
 )
 
 
-def _env_str(name: str) -> str | None:
-    v = os.environ.get(name)
-    if v is None:
-        return None
-    s = v.strip()
-    return s if s else None
-
-
-def _env_int(name: str) -> int | None:
-    v = _env_str(name)
-    if v is None:
-        return None
-    try:
-        return int(v)
-    except ValueError as e:
-        raise ConfigError(f"Invalid integer in env {name}={v!r}") from e
-
-
-def _env_float(name: str) -> float | None:
-    v = _env_str(name)
-    if v is None:
-        return None
-    try:
-        return float(v)
-    except ValueError as e:
-        raise ConfigError(f"Invalid float in env {name}={v!r}") from e
-
-
+@functools.cache
 def _default_root() -> Path:
     # Match prior behavior: --root defaults to current working directory.
+    # The CLI never chdirs, so one getcwd() per process is enough.
     return Path.cwd()
 
 
@@ -59,6 +51,46 @@ def _resolve_root(root: Path | None) -> Path:
     return env_root if env_root is not None else _default_root()
 
 
+# Ratio gate flags: parameter name -> (env var, help). The flag is the parameter name in
+# kebab case and the default comes from `Ratios`, so the three can't drift apart.
+_RATIO_OPTIONS: Final[dict[str, tuple[str, str]]] = {
+    "ratio_ok_get_hello": (
+        "RATIO_OK",
+        "Gate: wrkr_rps must be >= wrk_rps * ratio.",
+    ),
+    "ratio_ok_post_json": (
+        "RATIO_OK_POST_JSON",
+        "Gate: wrkr_rps must be >= wrk_rps * ratio.",
+    ),
+    "ratio_ok_wfb_json_aggregate": (
+        "RATIO_OK_WFB_JSON_AGGREGATE",
+        "Gate: wrkr_rps must be >= wrk_rps * ratio.",
+    ),
+    "ratio_ok_wrkr_over_k6": (
+        "RATIO_OK_WRKR_OVER_K6",
+        "Gate: wrkr_rps must be > k6_rps * ratio.",
+    ),
+    "ratio_ok_grpc_wrkr_over_k6": (
+        "RATIO_OK_GRPC_WRKR_OVER_K6",
+        "Gate for gRPC: wrkr_rps must be > k6_rps * ratio.",
+    ),
+    "ratio_ok_wfb_grpc_aggregate_wrkr_over_k6": (
+        "RATIO_OK_WFB_GRPC_AGGREGATE_WRKR_OVER_K6",
+        "Gate for wfb gRPC AggregateOrders: wrkr_rps must be > k6_rps * ratio.",
+    ),
+    "ratio_ok_grpc_wrkr_over_wrk_hello": (
+        "RATIO_OK_GRPC_WRKR_OVER_WRK_HELLO",
+        "Optional cross-protocol gate: wrkr gRPC RPS must be >= wrk GET /hello RPS * ratio.",
+    ),
+}
+_DEFAULT_RATIOS: Final = Ratios()
+
+
+def _ratio_option(name: str) -> Any:
+    envvar, help_text = _RATIO_OPTIONS[name]
+    return typer.Option("--" + name.replace("_", "-"), help=help_text, envvar=envvar)
+
+
 @app.command()
 def run(
     # Root / duration / build flags
@@ -133,63 +165,53 @@ def run(
             min=1,
         ),
     ] = 256,
-    # Gates / ratios
-    ratio_ok_get_hello: Annotated[
-        float,
+    parallel_cases: Annotated[
+        int,
         typer.Option(
-            "--ratio-ok-get-hello",
-            help="Gate: wrkr_rps must be >= wrk_rps * ratio.",
-            envvar="RATIO_OK",
+            "--parallel-cases",
+            help="Max cases to run concurrently (1 = sequential). The first HTTP and gRPC cases always run alone since they feed the cross-protocol gate.",
+            envvar="PARALLEL_CASES",
+            min=1,
         ),
-    ] = 0.90,
-    ratio_ok_post_json: Annotated[
-        float,
+    ] = 1,
+    parallel_tools: Annotated[
+        bool,
         typer.Option(
-            "--ratio-ok-post-json",
-            help="Gate: wrkr_rps must be >= wrk_rps * ratio.",
-            envvar="RATIO_OK_POST_JSON",
+            "--parallel-tools/--sequential-tools",
+            help="Run wrk, wrkr and k6 of a case at the same time. Much faster, but the tools compete for the testserver, so ratio gates are not meaningful (smoke runs only).",
+            envvar="PARALLEL_TOOLS",
         ),
-    ] = 0.90,
-    ratio_ok_wfb_json_aggregate: Annotated[
-        float,
+    ] = False,
+    use_cache: Annotated[
+        bool,
         typer.Option(
-            "--ratio-ok-wfb-json-aggregate",
-            help="Gate: wrkr_rps must be >= wrk_rps * ratio.",
-            envvar="RATIO_OK_WFB_JSON_AGGREGATE",
+            "--cache/--no-cache",
+            help="Reuse results of tool runs whose script (plus its sibling lib/ and protos/ files), arguments, binaries and parallel mode are unchanged; other inputs such as env vars are not tracked (stored under $XDG_CACHE_HOME/wrkr-compare-perf).",
+            envvar="USE_CACHE",
         ),
-    ] = 0.90,
+    ] = False,
+    # Gates / ratios (see `_RATIO_OPTIONS`)
+    ratio_ok_get_hello: Annotated[
+        float, _ratio_option("ratio_ok_get_hello")
+    ] = _DEFAULT_RATIOS.ratio_ok_get_hello,
+    ratio_ok_post_json: Annotated[
+        float, _ratio_option("ratio_ok_post_json")
+    ] = _DEFAULT_RATIOS.ratio_ok_post_json,
+    ratio_ok_wfb_json_aggregate: Annotated[
+        float, _ratio_option("ratio_ok_wfb_json_aggregate")
+    ] = _DEFAULT_RATIOS.ratio_ok_wfb_json_aggregate,
     ratio_ok_wrkr_over_k6: Annotated[
-        float,
-        typer.Option(
-            "--ratio-ok-wrkr-over-k6",
-            help="Gate: wrkr_rps must be > k6_rps * ratio.",
-            envvar="RATIO_OK_WRKR_OVER_K6",
-        ),
-    ] = 1.40,
+        float, _ratio_option("ratio_ok_wrkr_over_k6")
+    ] = _DEFAULT_RATIOS.ratio_ok_wrkr_over_k6,
     ratio_ok_grpc_wrkr_over_k6: Annotated[
-        float,
-        typer.Option(
-            "--ratio-ok-grpc-wrkr-over-k6",
-            help="Gate for gRPC: wrkr_rps must be > k6_rps * ratio.",
-            envvar="RATIO_OK_GRPC_WRKR_OVER_K6",
-        ),
-    ] = 2.00,
+        float, _ratio_option("ratio_ok_grpc_wrkr_over_k6")
+    ] = _DEFAULT_RATIOS.ratio_ok_grpc_wrkr_over_k6,
     ratio_ok_wfb_grpc_aggregate_wrkr_over_k6: Annotated[
-        float,
-        typer.Option(
-            "--ratio-ok-wfb-grpc-aggregate-wrkr-over-k6",
-            help="Gate for wfb gRPC AggregateOrders: wrkr_rps must be > k6_rps * ratio.",
-            envvar="RATIO_OK_WFB_GRPC_AGGREGATE_WRKR_OVER_K6",
-        ),
-    ] = 1.20,
+        float, _ratio_option("ratio_ok_wfb_grpc_aggregate_wrkr_over_k6")
+    ] = _DEFAULT_RATIOS.ratio_ok_wfb_grpc_aggregate_wrkr_over_k6,
     ratio_ok_grpc_wrkr_over_wrk_hello: Annotated[
-        float,
-        typer.Option(
-            "--ratio-ok-grpc-wrkr-over-wrk-hello",
-            help="Optional cross-protocol gate: wrkr gRPC RPS must be >= wrk GET /hello RPS * ratio.",
-            envvar="RATIO_OK_GRPC_WRKR_OVER_WRK_HELLO",
-        ),
-    ] = 0.70,
+        float, _ratio_option("ratio_ok_grpc_wrkr_over_wrk_hello")
+    ] = _DEFAULT_RATIOS.ratio_ok_grpc_wrkr_over_wrk_hello,
     # Tool requirements
     require_wrk: Annotated[
         bool,
@@ -221,22 +243,14 @@ def run(
     This command is the primary interface and is intended to fully replace
     the former Rust tool's CLI surface.
     """
-    # Also accept the exact legacy env var names for a couple of flags where clap used env=...
-    # Typer's envvar already covers these, but we keep a tiny bit of compatibility logic for
-    # users who rely on env-only overrides while invoking without flags.
-    if "RATIO_OK" in os.environ and ratio_ok_get_hello == 0.90:
-        v = _env_float("RATIO_OK")
-        if v is not None:
-            ratio_ok_get_hello = v
+    # Deferred: `.app` pulls in the whole runner stack (rich, cases, build, ...), which
+    # `--help` and argument errors never need.
+    from .app import config_from_values
+    from .app import run as run_suite
 
     root_path = _resolve_root(root)
 
-    color_norm = color.strip().lower()
-    if color_norm not in {"auto", "always", "never"}:
-        raise ConfigError(
-            f"Invalid --color value: {color!r} (expected one of: auto, always, never)"
-        )
-    color = color_norm
+    color_mode = parse_color_mode(color)
 
     cfg = config_from_values(
         root=root_path,
@@ -247,6 +261,9 @@ def run(
         k6_vus=k6_vus,
         wrk_threads=wrk_threads,
         wrk_connections=wrk_connections,
+        parallel_cases=parallel_cases,
+        parallel_tools=parallel_tools,
+        use_cache=use_cache,
         ratio_ok_get_hello=ratio_ok_get_hello,
         ratio_ok_post_json=ratio_ok_post_json,
         ratio_ok_wfb_json_aggregate=ratio_ok_wfb_json_aggregate,
@@ -259,7 +276,7 @@ def run(
     )
 
     try:
-        outcome = run_suite(cfg, color=color)
+        outcome = run_suite(cfg, color=color_mode)
     except ConfigError as e:
         typer.secho(f"CONFIG ERROR: {e}", fg=typer.colors.RED, err=True)
         raise typer.Exit(code=2) from e
@@ -272,9 +289,24 @@ def run(
         raise typer.Exit(code=1)
 
 
+def _print_version(value: bool) -> None:
+    if value:
+        typer.echo(f"wrkr-tools-compare-perf {__version__}")
+        raise typer.Exit()
+
+
 @app.callback(invoke_without_command=True)
 def _default(
     ctx: typer.Context,
+    version: Annotated[
+        bool,
+        typer.Option(
+            "--version",
+            help="Show the version and exit.",
+            callback=_print_version,
+            is_eager=True,
+        ),
+    ] = False,
 ) -> None:
     """
     Default behavior: run the suite (matching prior tool which ran immediately).
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
+import functools
 import os
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Final
+from typing import Final, Literal, NamedTuple, NoReturn
 
-_DURATION_RE: Final[re.Pattern[str]] = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(ms|s|m)\s*$")
+# Output color modes for the final summaries (`--color`).
+type ColorMode = Literal["auto", "always", "never"]
+_COLOR_MODES: Final[dict[str, ColorMode]] = {"auto": "auto", "always": "always", "never": "never"}
+
+_TRUTHY: Final[frozenset[str]] = frozenset({"1", "true", "yes", "y", "on"})
+_FALSY: Final[frozenset[str]] = frozenset({"0", "false", "no", "n", "off"})
 
 
 class ConfigError(ValueError):
     """Raised when CLI/env configuration values are invalid."""
 
 
-@dataclass(frozen=True, slots=True)
-class Ratios:
+class Ratios(NamedTuple):
     """
     Ratio gates.
 
@@ -34,8 +38,7 @@ class Ratios:
     ratio_ok_grpc_wrkr_over_wrk_hello: float = 0.70
 
 
-@dataclass(frozen=True, slots=True)
-class ToolRequirements:
+class ToolRequirements(NamedTuple):
     require_wrk: bool = False
     require_k6: bool = False
 
@@ -53,6 +56,14 @@ class RunTuning:
     build: bool = True
     native: bool = True
 
+    # How many cases may run at the same time. 1 keeps the classic sequential order.
+    parallel_cases: int = 1
+    # Run a case's wrk/wrkr/k6 at the same time. They then compete for the testserver, so
+    # this is for smoke/correctness runs, not for ratio gating.
+    parallel_tools: bool = False
+    # Replay unchanged tool runs from the on-disk cache (see cache.py).
+    use_cache: bool = False
+
 
 @dataclass(frozen=True, slots=True)
 class Config:
@@ -69,38 +80,84 @@ class Config:
     ratios: Ratios = Ratios()
     requirements: ToolRequirements = ToolRequirements()
 
+    # Display strings derived from `tuning`, rendered once here instead of at every call site.
+    status_wrk_str: str = field(init=False, repr=False, compare=False)
+    status_wrkr_str: str = field(init=False, repr=False, compare=False)
+    status_k6_str: str = field(init=False, repr=False, compare=False)
+    conditions_load_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        t = self.tuning
+        k6_vus = self.effective_k6_vus()
+        # Frozen dataclass: derived fields have to bypass the generated __setattr__.
+        object.__setattr__(
+            self, "status_wrk_str", f"threads={t.wrk_threads} conns={t.wrk_connections}"
+        )
+        object.__setattr__(self, "status_wrkr_str", f"vus={t.wrkr_vus}")
+        object.__setattr__(self, "status_k6_str", f"vus={k6_vus}")
+        object.__setattr__(
+            self,
+            "conditions_load_str",
+            f"wrkr_vus={t.wrkr_vus} k6_vus={k6_vus} "
+            f"wrk_threads={t.wrk_threads} wrk_connections={t.wrk_connections}",
+        )
+
     def effective_k6_vus(self) -> int:
         return self.tuning.k6_vus if self.tuning.k6_vus is not None else self.tuning.wrkr_vus
 
 
+@functools.lru_cache(maxsize=8)
 def parse_duration_to_seconds(value: str) -> float:
     """
     Parse durations like "5s", "2.5s", "200ms", "1m" to seconds.
 
     This is used for validations and any rate computations that need numeric time.
     It is *not* a general-purpose parser; it intentionally supports only what this tool needs.
+    A run only ever sees a handful of distinct values, so results are memoized.
     """
-    m = _DURATION_RE.match(value)
-    if not m:
-        raise ConfigError(
-            f"Invalid duration {value!r}. Expected formats like '200ms', '5s', '1m' (decimals allowed)."
-        )
-
-    amount_s = float(m.group(1))
-    unit = m.group(2)
-
-    if amount_s < 0:
-        raise ConfigError(f"Duration must be non-negative, got {value!r}.")
-
+    s = value.strip()
+    # "ms" is checked before "s" (it ends with "s" too).
+    if s.endswith("ms"):
+        number, unit = s[:-2], "ms"
+    elif s.endswith("s"):
+        number, unit = s[:-1], "s"
+    elif s.endswith("m"):
+        number, unit = s[:-1], "m"
+    else:
+        raise _invalid_duration(value)
+
+    # Same grammar as before: digits with an optional fractional part, whitespace allowed
+    # before the unit. No signs, exponents, underscores or inf/nan (all of which float() takes).
+    number = number.rstrip()
+    whole, dot, frac = number.partition(".")
+    if not whole.isdecimal() or (dot and not frac.isdecimal()):
+        raise _invalid_duration(value)
+
+    amount_s = float(number)
     if unit == "ms":
         return amount_s / 1000.0
     if unit == "s":
         return amount_s
-    if unit == "m":
-        return amount_s * 60.0
+    return amount_s * 60.0
+
+
+def _invalid_duration(value: str) -> ConfigError:
+    return ConfigError(
+        f"Invalid duration {value!r}. Expected formats like '200ms', '5s', '1m' (decimals allowed)."
+    )
+
 
-    # Should be unreachable due to regex.
-    raise ConfigError(f"Unsupported duration unit in {value!r}.")
+def parse_color_mode(value: str) -> ColorMode:
+    """Normalize a `--color` value (case/whitespace-insensitive) to a `ColorMode`."""
+    mode = _COLOR_MODES.get(value)
+    if mode is not None:
+        return mode
+    try:
+        return _COLOR_MODES[value.strip().lower()]
+    except KeyError:
+        raise ConfigError(
+            f"Invalid --color value: {value!r} (expected one of: auto, always, never)"
+        ) from None
 
 
 def env_path(name: str) -> Path | None:
@@ -109,10 +166,20 @@ def env_path(name: str) -> Path | None:
 
     Returns None if unset or empty.
     """
-    raw = os.environ.get(name)
-    if not raw:
+    try:
+        raw = os.environ[name]
+    except KeyError:
+        return None
+    return Path(raw) if raw else None
+
+
+def _env_stripped(name: str) -> str | None:
+    """Return the env var with surrounding whitespace removed, or None if unset/blank."""
+    try:
+        raw = os.environ[name]
+    except KeyError:
         return None
-    return Path(raw)
+    return raw.strip() or None
 
 
 def env_bool(name: str, *, default: bool) -> bool:
@@ -123,14 +190,18 @@ def env_bool(name: str, *, default: bool) -> bool:
     Falsy:  0, false, no, n, off
     Unset:  default
     """
-    raw = os.environ.get(name)
-    if raw is None:
+    try:
+        raw = os.environ[name]
+    except KeyError:
         return default
 
-    v = raw.strip().lower()
-    if v in {"1", "true", "yes", "y", "on"}:
+    v = raw.strip()
+    if v not in _TRUTHY and v not in _FALSY:
+        # Only non-canonical spellings ("True", "ON", ...) pay for case folding.
+        v = v.lower()
+    if v in _TRUTHY:
         return True
-    if v in {"0", "false", "no", "n", "off"}:
+    if v in _FALSY:
         return False
 
     raise ConfigError(
@@ -145,8 +216,8 @@ def env_int(name: str) -> int | None:
 
     Returns None if unset/empty.
     """
-    raw = os.environ.get(name)
-    if raw is None or raw.strip() == "":
+    raw = _env_stripped(name)
+    if raw is None:
         return None
     try:
         return int(raw)
@@ -160,8 +231,8 @@ def env_float(name: str) -> float | None:
 
     Returns None if unset/empty.
     """
-    raw = os.environ.get(name)
-    if raw is None or raw.strip() == "":
+    raw = _env_stripped(name)
+    if raw is None:
         return None
     try:
         return float(raw)
@@ -175,21 +246,28 @@ def validate_ratios(r: Ratios) -> None:
 
     Ratios should be positive. We allow > 1.0 (common for wrkr-over-k6 gates).
     """
-    fields = (
-        ("ratio_ok_get_hello", r.ratio_ok_get_hello),
-        ("ratio_ok_post_json", r.ratio_ok_post_json),
-        ("ratio_ok_wfb_json_aggregate", r.ratio_ok_wfb_json_aggregate),
-        ("ratio_ok_wrkr_over_k6", r.ratio_ok_wrkr_over_k6),
-        ("ratio_ok_grpc_wrkr_over_k6", r.ratio_ok_grpc_wrkr_over_k6),
-        (
-            "ratio_ok_wfb_grpc_aggregate_wrkr_over_k6",
-            r.ratio_ok_wfb_grpc_aggregate_wrkr_over_k6,
-        ),
-        ("ratio_ok_grpc_wrkr_over_wrk_hello", r.ratio_ok_grpc_wrkr_over_wrk_hello),
-    )
-    for name, value in fields:
-        if value <= 0:
-            raise ConfigError(f"{name} must be > 0, got {value}.")
+    if r.ratio_ok_get_hello <= 0:
+        _raise_non_positive_ratio("ratio_ok_get_hello", r.ratio_ok_get_hello)
+    if r.ratio_ok_post_json <= 0:
+        _raise_non_positive_ratio("ratio_ok_post_json", r.ratio_ok_post_json)
+    if r.ratio_ok_wfb_json_aggregate <= 0:
+        _raise_non_positive_ratio("ratio_ok_wfb_json_aggregate", r.ratio_ok_wfb_json_aggregate)
+    if r.ratio_ok_wrkr_over_k6 <= 0:
+        _raise_non_positive_ratio("ratio_ok_wrkr_over_k6", r.ratio_ok_wrkr_over_k6)
+    if r.ratio_ok_grpc_wrkr_over_k6 <= 0:
+        _raise_non_positive_ratio("ratio_ok_grpc_wrkr_over_k6", r.ratio_ok_grpc_wrkr_over_k6)
+    if r.ratio_ok_wfb_grpc_aggregate_wrkr_over_k6 <= 0:
+        _raise_non_positive_ratio(
+            "ratio_ok_wfb_grpc_aggregate_wrkr_over_k6", r.ratio_ok_wfb_grpc_aggregate_wrkr_over_k6
+        )
+    if r.ratio_ok_grpc_wrkr_over_wrk_hello <= 0:
+        _raise_non_positive_ratio(
+            "ratio_ok_grpc_wrkr_over_wrk_hello", r.ratio_ok_grpc_wrkr_over_wrk_hello
+        )
+
+
+def _raise_non_positive_ratio(name: str, value: float) -> NoReturn:
+    raise ConfigError(f"{name} must be > 0, got {value}.")
 
 
 def validate_tuning(t: RunTuning) -> None:
@@ -197,7 +275,7 @@ def validate_tuning(t: RunTuning) -> None:
     Validate runner tuning settings.
 
     - durations must parse
-    - VUs/threads/connections must be positive
+    - VUs/threads/connections/parallel cases must be positive
     """
     _ = parse_duration_to_seconds(t.duration)
 
@@ -209,3 +287,5 @@ def validate_tuning(t: RunTuning) -> None:
         raise ConfigError(f"wrk_threads must be > 0, got {t.wrk_threads}.")
     if t.wrk_connections <= 0:
         raise ConfigError(f"wrk_connections must be > 0, got {t.wrk_connections}.")
+    if t.parallel_cases <= 0:
+        raise ConfigError(f"parallel_cases must be > 0, got {t.parallel_cases}.")
@@ -1,25 +0,0 @@
-from __future__ import annotations
-
-from wrkr_tools_common.exec import (
-    ExecError,
-    RunResult,
-    format_command,
-    print_invocation,
-    quote_for_display,
-    run_checked,
-    run_checked_streaming,
-    run_with_peak_rss_sampling,
-    run_with_peak_rss_sampling_streaming,
-)
-
-__all__ = [
-    "ExecError",
-    "RunResult",
-    "format_command",
-    "print_invocation",
-    "quote_for_display",
-    "run_checked",
-    "run_checked_streaming",
-    "run_with_peak_rss_sampling",
-    "run_with_peak_rss_sampling_streaming",
-]
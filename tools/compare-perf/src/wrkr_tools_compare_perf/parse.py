@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Final
 
@@ -11,6 +11,7 @@ class ParseError(RuntimeError):
 
 
 _DIAG_MAX_CHARS: Final[int] = 4096
+_DIAG_TAIL_LINES: Final[int] = 12
 
 
 @dataclass(frozen=True, slots=True)
@@ -30,55 +31,51 @@ class ParseDiagnostics:
     stderr_tail: str
 
     def format(self) -> str:
-        out = truncate(self.stdout_tail, _DIAG_MAX_CHARS)
-        err = truncate(self.stderr_tail, _DIAG_MAX_CHARS)
         return (
             f"{self.message}\n"
-            f"--- {self.kind} stdout (tail) ---\n{out}\n"
-            f"--- {self.kind} stderr (tail) ---\n{err}"
+            f"--- {self.kind} stdout (tail) ---\n{self.stdout_tail}\n"
+            f"--- {self.kind} stderr (tail) ---\n{self.stderr_tail}"
         )
 
 
-def parse_wrk_rps(stdout: str) -> Rps:
-    """
-    Parse wrk RPS from stdout.
+@dataclass(frozen=True, slots=True)
+class WrkSignals:
+    """Everything compare-perf reads from one wrk run, gathered in a single pass over stdout.
 
-    Expected line format:
-        Requests/sec: 12345.67
+    `rps` comes from the first `Requests/sec:` line. When it is None, `rps_error` explains why.
+    `errors` lists the correctness issues reported by `detect_wrk_errors`.
     """
-    for raw in stdout.splitlines():
-        line = raw.strip()
-        if not line.startswith("Requests/sec:"):
-            continue
 
-        rest = line.removeprefix("Requests/sec:").strip()
-        token = rest.split()[0] if rest else ""
-        if not token:
-            raise ParseError("failed to parse wrk RPS (missing token after 'Requests/sec:')")
-
-        try:
-            rps = float(token)
-        except ValueError as e:
-            raise ParseError(f"failed to parse wrk RPS (invalid float token: {token!r})") from e
+    rps: Rps | None
+    rps_error: str | None
+    errors: tuple[str, ...]
 
-        return Rps(rps)
 
-    raise ParseError("failed to parse wrk RPS (no 'Requests/sec:' line found)")
+_WRK_SIGNAL_PREFIXES: Final = ("Requests/sec:", "Non-2xx or 3xx responses:", "Socket errors:")
 
 
-def detect_wrk_errors(stdout: str) -> list[str]:
-    """Detect correctness issues in wrk output.
-
-    wrk often returns exit code 0 even when there were request failures.
-
-    We treat the following as correctness errors:
-    - Non-2xx or 3xx responses > 0
-    - Socket errors counts > 0
-    """
+def scan_wrk_output(stdout: str) -> WrkSignals:
+    """Scan wrk stdout once for the RPS line and the correctness error counters."""
+    rps: Rps | None = None
+    rps_error: str | None = "failed to parse wrk RPS (no 'Requests/sec:' line found)"
+    seen_rps = False
     errors: list[str] = []
 
-    for raw in stdout.splitlines():
-        line = raw.strip()
+    for raw in stdout.split("\n"):
+        line = raw.lstrip()
+        # Most of wrk's report (latency tables, distribution) matches none of these.
+        if not line.startswith(_WRK_SIGNAL_PREFIXES):
+            continue
+        line = line.rstrip()
+
+        if line.startswith("Requests/sec:"):
+            if not seen_rps:
+                seen_rps = True
+                try:
+                    rps, rps_error = _parse_wrk_rps_line(line), None
+                except ParseError as e:
+                    rps_error = str(e)
+            continue
 
         if line.startswith("Non-2xx or 3xx responses:"):
             rest = line.removeprefix("Non-2xx or 3xx responses:").strip()
@@ -90,11 +87,50 @@ def detect_wrk_errors(stdout: str) -> list[str]:
             if n > 0:
                 errors.append(f"wrk non-2xx/3xx responses: {n}")
 
-        if line.startswith("Socket errors:"):
+        elif line.startswith("Socket errors:"):
             # Example: Socket errors: connect 0, read 12, write 0, timeout 0
             errors.extend(_parse_wrk_socket_errors_line(line))
 
-    return errors
+    return WrkSignals(rps=rps, rps_error=rps_error, errors=tuple(errors))
+
+
+def _parse_wrk_rps_line(line: str) -> Rps:
+    rest = line.removeprefix("Requests/sec:").strip()
+    token = rest.split()[0] if rest else ""
+    if not token:
+        raise ParseError("failed to parse wrk RPS (missing token after 'Requests/sec:')")
+
+    try:
+        rps = float(token)
+    except ValueError as e:
+        raise ParseError(f"failed to parse wrk RPS (invalid float token: {token!r})") from e
+
+    return Rps(rps)
+
+
+def parse_wrk_rps(stdout: str) -> Rps:
+    """
+    Parse wrk RPS from stdout.
+
+    Expected line format:
+        Requests/sec: 12345.67
+    """
+    signals = scan_wrk_output(stdout)
+    if signals.rps is None:
+        raise ParseError(signals.rps_error)
+    return signals.rps
+
+
+def detect_wrk_errors(stdout: str) -> list[str]:
+    """Detect correctness issues in wrk output.
+
+    wrk often returns exit code 0 even when there were request failures.
+
+    We treat the following as correctness errors:
+    - Non-2xx or 3xx responses > 0
+    - Socket errors counts > 0
+    """
+    return list(scan_wrk_output(stdout).errors)
 
 
 def _parse_wrk_socket_errors_line(line: str) -> list[str]:
@@ -132,8 +168,28 @@ def parse_wrkr_rps(*, stdout: str, stderr: str, test_duration_seconds: float | N
         iterations......................: ...
        Preference order: grpc_reqs, then http_reqs, then iterations.
     """
+    return wrkr_rps_from_summary(
+        try_parse_wrkr_json_summary(stdout=stdout, stderr=stderr),
+        stdout=stdout,
+        stderr=stderr,
+        test_duration_seconds=test_duration_seconds,
+    )
+
+
+def wrkr_rps_from_summary(
+    js: WrkrJsonSummary | None,
+    *,
+    stdout: str,
+    stderr: str,
+    test_duration_seconds: float | None = None,
+) -> Rps:
+    """
+    `parse_wrkr_rps` for callers that already hold the `try_parse_wrkr_json_summary` result.
+
+    Lets a case read the NDJSON output once for both the summary and the RPS; the text is only
+    scanned again when there was no JSON at all.
+    """
     # Prefer machine-readable NDJSON when present.
-    js = try_parse_wrkr_json_summary(stdout=stdout, stderr=stderr)
     if js is not None:
         # If we know the intended test duration, compute average RPS from final totals.
         # This avoids relying on the last progress line rate and keeps compare-perf consistent.
@@ -155,40 +211,37 @@ def parse_wrkr_rps(*, stdout: str, stderr: str, test_duration_seconds: float | N
         try:
             return _parse_wrkr_rps_text(stderr)
         except ParseError as e:
-            diag = ParseDiagnostics(
-                kind="wrkr",
-                message=str(e),
-                stdout_tail=tail_lines(stdout, 12),
-                stderr_tail=tail_lines(stderr, 12),
-            )
-            raise ParseError(diag.format()) from e
+            raise _diagnosed_error("wrkr", str(e), stdout=stdout, stderr=stderr) from e
 
 
 def _parse_wrkr_rps_text(text: str) -> Rps:
-    # Legacy: rps: 1234
-    for raw in text.splitlines():
-        line = raw.strip()
-        if not line.startswith("rps:"):
-            continue
-
-        rest = line.removeprefix("rps:").strip()
-        token = rest.split()[0] if rest else ""
-        if not token:
-            raise ParseError("failed to parse wrkr RPS (missing token after 'rps:')")
-
-        try:
-            rps = float(token)
-        except ValueError as e:
-            raise ParseError(f"failed to parse wrkr RPS (invalid float token: {token!r})") from e
-
-        return Rps(rps)
-
-    # k6-like summary: prefer grpc_reqs (grpc scripts may also print http_reqs=0).
+    # One pass over the lines: a legacy `rps: 1234` line wins outright; otherwise fall back to
+    # the k6-like summary, preferring grpc_reqs (grpc scripts may also print http_reqs=0).
     grpc_rps: float | None = None
     http_rps: float | None = None
     iterations_rps: float | None = None
 
-    for line in text.splitlines():
+    for raw in text.split("\n"):
+        # Only candidate legacy lines are stripped; the indented summary lines match as-is.
+        line = raw.strip() if "rps:" in raw else raw
+        if line.startswith("rps:"):
+            rest = line.removeprefix("rps:").strip()
+            token = rest.split()[0] if rest else ""
+            if not token:
+                raise ParseError("failed to parse wrkr RPS (missing token after 'rps:')")
+
+            try:
+                rps = float(token)
+            except ValueError as e:
+                raise ParseError(
+                    f"failed to parse wrkr RPS (invalid float token: {token!r})"
+                ) from e
+
+            return Rps(rps)
+
+        # Cheap prefilter: most lines mention none of the summary counters.
+        if "_reqs" not in line and "iterations" not in line:
+            continue
         if "grpc_reqs" in line:
             r = parse_paren_rate_token(line)
             if r is not None:
@@ -251,8 +304,10 @@ def try_parse_wrkr_json_summary(*, stdout: str, stderr: str) -> WrkrJsonSummary
     last_summary: dict[str, object] | None = None
     saw_json = False
 
-    for text in (stdout, stderr):
-        for raw in text.splitlines():
+    # Only the last progress and summary lines matter, so walk the output backwards (stderr
+    # after stdout, as wrkr would have written it) and stop decoding once both are found.
+    for text in (stderr, stdout):
+        for raw in _iter_lines_reversed(text):
             obj = _try_parse_json_object_line(raw)
             if obj is None:
                 continue
@@ -262,9 +317,16 @@ def try_parse_wrkr_json_summary(*, stdout: str, stderr: str) -> WrkrJsonSummary
             if kind == "progress" or (
                 kind is None and "elapsed_secs" in obj and "total_requests" in obj
             ):
-                last_progress = obj
-            elif kind == "summary" or (kind is None and "totals" in obj and "scenarios" in obj):
+                if last_progress is None:
+                    last_progress = obj
+            elif last_summary is None and (
+                kind == "summary" or (kind is None and "totals" in obj and "scenarios" in obj)
+            ):
                 last_summary = obj
+            if last_progress is not None and last_summary is not None:
+                break
+        if last_progress is not None and last_summary is not None:
+            break
 
     if last_progress is None and last_summary is None:
         return None if not saw_json else _raise_wrkr_json_error(stdout=stdout, stderr=stderr)
@@ -277,9 +339,19 @@ def try_parse_wrkr_json_summary(*, stdout: str, stderr: str) -> WrkrJsonSummary
     )
 
 
+def _iter_lines_reversed(text: str) -> Iterator[str]:
+    """Yield the `\n`-separated lines of `text` last first, without splitting all of it."""
+    end = len(text)
+    while end > 0:
+        start = text.rfind("\n", 0, end) + 1
+        yield text[start:end]
+        end = start - 1
+
+
 def _try_parse_json_object_line(line: str) -> dict[str, object] | None:
     s = line.strip()
-    if not s or not s.startswith("{"):
+    # A JSON object line is framed by braces; anything else would only fail in json.loads.
+    if not s.startswith("{") or not s.endswith("}"):
         return None
     try:
         v = json.loads(s)
@@ -428,13 +500,7 @@ def _parse_wrkr_json_summary_obj(
             latency_p99_seconds = float(_json_int(progress, "latency_p99")) / 1_000_000.0
             latency_max_seconds = float(_json_int(progress, "latency_max")) / 1_000_000.0
     except ParseError as e:
-        diag = ParseDiagnostics(
-            kind="wrkr-json",
-            message=str(e),
-            stdout_tail=tail_lines(stdout, 12),
-            stderr_tail=tail_lines(stderr, 12),
-        )
-        raise ParseError(diag.format()) from e
+        raise _diagnosed_error("wrkr-json", str(e), stdout=stdout, stderr=stderr) from e
 
     if rps_avg < 0.0:
         raise ParseError(f"wrkr json: rps must be non-negative, got {rps_avg!r}")
@@ -455,13 +521,12 @@ def _parse_wrkr_json_summary_obj(
 
 
 def _raise_wrkr_json_error(*, stdout: str, stderr: str) -> None:
-    diag = ParseDiagnostics(
-        kind="wrkr-json",
-        message="failed to parse wrkr JSON progress lines (no progress objects found)",
-        stdout_tail=tail_lines(stdout, 12),
-        stderr_tail=tail_lines(stderr, 12),
+    raise _diagnosed_error(
+        "wrkr-json",
+        "failed to parse wrkr JSON progress lines (no progress objects found)",
+        stdout=stdout,
+        stderr=stderr,
     )
-    raise ParseError(diag.format())
 
 
 def _json_int(obj: dict[str, object], key: str) -> int:
@@ -521,6 +586,100 @@ def _ms_round_int(v: float | None) -> int | None:
     return round(v)
 
 
+@dataclass(frozen=True, slots=True)
+class K6Signals:
+    """Everything compare-perf reads from one k6 run, gathered in a single pass per stream.
+
+    Rates and failure fractions follow the `parse_k6_*` precedence rules: stdout wins over
+    stderr, and the first matching line wins within a stream.
+    """
+
+    http_rps: Rps | None
+    grpc_rps: Rps | None
+    http_req_failed: float | None
+    grpc_req_failed: float | None
+    request_failed_warnings: int
+
+
+@dataclass(slots=True)
+class _K6StreamScan:
+    http_reqs_rate: float | None = None
+    iterations_rate: float | None = None
+    grpc_rate: float | None = None
+    progress_rate: float | None = None
+    http_req_failed: float | None = None
+    http_req_failed_seen: bool = False
+    grpc_req_failed: float | None = None
+    grpc_req_failed_seen: bool = False
+    request_failed_warnings: int = 0
+
+    def http_rate(self) -> float | None:
+        # Preferred http_reqs, then iterations (1 request per iteration), then progress lines.
+        if self.http_reqs_rate is not None:
+            return self.http_reqs_rate
+        if self.iterations_rate is not None:
+            return self.iterations_rate
+        return self.progress_rate
+
+    def grpc_or_http_rate(self) -> float | None:
+        # grpc_reqs/iterations, falling back to the HTTP rules for builds without grpc_reqs.
+        return self.grpc_rate if self.grpc_rate is not None else self.http_rate()
+
+
+_K6_REQUEST_FAILED: Final = 'msg="Request Failed"'
+
+
+def _scan_k6_stream(text: str) -> _K6StreamScan:
+    sc = _K6StreamScan(request_failed_warnings=text.count(_K6_REQUEST_FAILED))
+    for raw in text.split("\n"):
+        # Every line we care about below names a k6 metric or is a progress line.
+        if "_req" not in raw and "iterations" not in raw:
+            continue
+
+        if sc.http_reqs_rate is None and "http_reqs" in raw:
+            sc.http_reqs_rate = parse_slash_s_token(raw)
+        if "iterations" in raw:
+            if sc.iterations_rate is None:
+                sc.iterations_rate = parse_slash_s_token(raw)
+            if sc.progress_rate is None:
+                sc.progress_rate = parse_k6_progress_rps(raw)
+        if sc.grpc_rate is None and ("grpc_reqs" in raw or "iterations" in raw):
+            sc.grpc_rate = parse_slash_s_token(raw)
+
+        if not sc.http_req_failed_seen and "http_req_failed" in raw:
+            sc.http_req_failed_seen = True
+            sc.http_req_failed = _parse_k6_pct_fraction(raw)
+        if not sc.grpc_req_failed_seen and "grpc_req_failed" in raw:
+            sc.grpc_req_failed_seen = True
+            sc.grpc_req_failed = _parse_k6_pct_fraction(raw)
+    return sc
+
+
+def scan_k6_output(*, stdout: str, stderr: str) -> K6Signals:
+    """Scan k6 output once per stream and collect rates, failure rates and warning counts."""
+    out = _scan_k6_stream(stdout)
+    err = _scan_k6_stream(stderr)
+
+    http_rate = _first_not_none(out.http_rate(), err.http_rate())
+    grpc_rate = _first_not_none(out.grpc_or_http_rate(), err.grpc_or_http_rate())
+    http_failed = _first_not_none(out.http_req_failed, err.http_req_failed)
+    grpc_failed = _first_not_none(out.grpc_req_failed, err.grpc_req_failed)
+
+    return K6Signals(
+        http_rps=None if http_rate is None else Rps(http_rate),
+        grpc_rps=None if grpc_rate is None else Rps(grpc_rate),
+        http_req_failed=http_failed,
+        # Falls back to http_req_failed for builds/scripts that don't emit grpc_req_failed.
+        grpc_req_failed=grpc_failed if grpc_failed is not None else http_failed,
+        request_failed_warnings=out.request_failed_warnings + err.request_failed_warnings,
+    )
+
+
+def k6_rps_parse_error(*, stdout: str, stderr: str) -> ParseError:
+    """The error `parse_k6_*_rps` raise when no rate is found, with output tails attached."""
+    return _diagnosed_error("k6", "failed to parse k6 http RPS", stdout=stdout, stderr=stderr)
+
+
 def parse_k6_http_rps(*, stdout: str, stderr: str) -> Rps:
     """
     Parse k6 HTTP RPS from stdout/stderr.
@@ -533,40 +692,10 @@ def parse_k6_http_rps(*, stdout: str, stderr: str) -> Rps:
         running (02.0s), ... 155325 complete ... iterations
       => completed / seconds
     """
-    try:
-        return _parse_k6_http_rps_text(stdout)
-    except ParseError:
-        try:
-            return _parse_k6_http_rps_text(stderr)
-        except ParseError as e:
-            diag = ParseDiagnostics(
-                kind="k6",
-                message=str(e),
-                stdout_tail=tail_lines(stdout, 12),
-                stderr_tail=tail_lines(stderr, 12),
-            )
-            raise ParseError(diag.format()) from e
-
-
-def _parse_k6_http_rps_text(text: str) -> Rps:
-    for line in text.splitlines():
-        if "http_reqs" in line:
-            rate = parse_slash_s_token(line)
-            if rate is not None:
-                return Rps(rate)
-
-    for line in text.splitlines():
-        if "iterations" in line:
-            rate = parse_slash_s_token(line)
-            if rate is not None:
-                return Rps(rate)
-
-    for line in text.splitlines():
-        rate = parse_k6_progress_rps(line)
-        if rate is not None:
-            return Rps(rate)
-
-    raise ParseError("failed to parse k6 http RPS")
+    rps = scan_k6_output(stdout=stdout, stderr=stderr).http_rps
+    if rps is None:
+        raise k6_rps_parse_error(stdout=stdout, stderr=stderr)
+    return rps
 
 
 def parse_k6_grpc_rps(*, stdout: str, stderr: str) -> Rps:
@@ -577,40 +706,15 @@ def parse_k6_grpc_rps(*, stdout: str, stderr: str) -> Rps:
       1234.5/s
     Some k6 builds may only print http_reqs; we fall back to HTTP parsing.
     """
-    try:
-        return _parse_k6_grpc_rps_text(stdout)
-    except ParseError:
-        try:
-            return _parse_k6_grpc_rps_text(stderr)
-        except ParseError as e:
-            diag = ParseDiagnostics(
-                kind="k6",
-                message=str(e),
-                stdout_tail=tail_lines(stdout, 12),
-                stderr_tail=tail_lines(stderr, 12),
-            )
-            raise ParseError(diag.format()) from e
-
-
-def _parse_k6_grpc_rps_text(text: str) -> Rps:
-    for line in text.splitlines():
-        if "grpc_reqs" not in line and "iterations" not in line:
-            continue
-        rate = parse_slash_s_token(line)
-        if rate is not None:
-            return Rps(rate)
-
-    # Fallback: some k6 builds print only http_reqs.
-    return _parse_k6_http_rps_text(text)
-
-
-_K6_PERCENT_RE: Final[re.Pattern[str]] = re.compile(r"(?P<pct>[0-9]+(?:\.[0-9]+)?)%")
-_K6_REQUEST_FAILED_RE: Final[re.Pattern[str]] = re.compile(r'msg="Request Failed"')
+    rps = scan_k6_output(stdout=stdout, stderr=stderr).grpc_rps
+    if rps is None:
+        raise k6_rps_parse_error(stdout=stdout, stderr=stderr)
+    return rps
 
 
 def parse_k6_http_req_failed_rate(*, stdout: str, stderr: str) -> float | None:
     """Parse k6 http_req_failed percentage as a fraction in [0, 1]."""
-    return _parse_k6_req_failed_rate(metric="http_req_failed", stdout=stdout, stderr=stderr)
+    return scan_k6_output(stdout=stdout, stderr=stderr).http_req_failed
 
 
 def parse_k6_grpc_req_failed_rate(*, stdout: str, stderr: str) -> float | None:
@@ -618,51 +722,43 @@ def parse_k6_grpc_req_failed_rate(*, stdout: str, stderr: str) -> float | None:
 
     Falls back to http_req_failed for builds/scripts that don't emit grpc_req_failed.
     """
-    rate = _parse_k6_req_failed_rate(metric="grpc_req_failed", stdout=stdout, stderr=stderr)
-    if rate is not None:
-        return rate
-    return _parse_k6_req_failed_rate(metric="http_req_failed", stdout=stdout, stderr=stderr)
-
-
-def _parse_k6_req_failed_rate(*, metric: str, stdout: str, stderr: str) -> float | None:
-    # Prefer stdout, then stderr.
-    v = _parse_k6_req_failed_rate_text(metric=metric, text=stdout)
-    if v is not None:
-        return v
-    return _parse_k6_req_failed_rate_text(metric=metric, text=stderr)
+    return scan_k6_output(stdout=stdout, stderr=stderr).grpc_req_failed
 
 
-def _parse_k6_req_failed_rate_text(*, metric: str, text: str) -> float | None:
+def _parse_k6_pct_fraction(line: str) -> float | None:
     # Typical line:
     #   http_req_failed..............: 0.15% ✓ 123 ✗ 4
     #   grpc_req_failed..............: 0.00% ✓ ...
-    for raw in text.splitlines():
-        line = raw.strip()
-        if metric not in line:
-            continue
+    # Takes the first `<digits>[.<digits>]%` token (ASCII digits), scanning back from each '%'.
+    pos = line.find("%")
+    while pos != -1:
+        start = _ascii_digits_start(line, pos)
+        if start < pos:
+            if start >= 2 and line[start - 1] == "." and line[start - 2] in _ASCII_DIGITS:
+                start = _ascii_digits_start(line, start - 1)
+            return float(line[start:pos]) / 100.0
+        pos = line.find("%", pos + 1)
+    return None
 
-        m = _K6_PERCENT_RE.search(line)
-        if m is None:
-            return None
-        try:
-            pct = float(m.group("pct"))
-        except ValueError:
-            return None
 
-        if pct < 0.0:
-            return None
-        return pct / 100.0
+_ASCII_DIGITS: Final[frozenset[str]] = frozenset("0123456789")
 
-    return None
+
+def _ascii_digits_start(s: str, end: int) -> int:
+    """Index where the run of ASCII digits ending right before `end` starts (`end` if none)."""
+    i = end
+    while i > 0 and s[i - 1] in _ASCII_DIGITS:
+        i -= 1
+    return i
 
 
 def count_k6_request_failed_warnings(*, stdout: str, stderr: str) -> int:
     """Count occurrences of k6's `msg="Request Failed"` warnings."""
-    return _count_re(_K6_REQUEST_FAILED_RE, stdout) + _count_re(_K6_REQUEST_FAILED_RE, stderr)
+    return scan_k6_output(stdout=stdout, stderr=stderr).request_failed_warnings
 
 
-def _count_re(pat: re.Pattern[str], text: str) -> int:
-    return sum(1 for _ in pat.finditer(text))
+def _first_not_none[T](a: T | None, b: T | None) -> T | None:
+    return a if a is not None else b
 
 
 def parse_paren_rate_token(line: str) -> float | None:
@@ -698,19 +794,35 @@ def parse_slash_s_token(line: str) -> float | None:
       (217130.60000/s)
       12.3k/s  (some builds)
     """
-    for raw in line.split():
-        token = raw.strip("(),")
-        if not token.endswith("/s"):
-            continue
-
-        number = token.removesuffix("/s")
-        v = parse_si_float(number)
-        if v is not None:
-            return v
+    # Jump between `/s` occurrences rather than splitting the line into tokens.
+    pos = line.find("/s")
+    while pos != -1:
+        end = pos + 2
+        while end < len(line) and line[end] in "(),":
+            end += 1
+        # Only a `/s` that ends its whitespace-separated token counts.
+        if end == len(line) or line[end].isspace():
+            start = pos
+            while start > 0 and not line[start - 1].isspace():
+                start -= 1
+            v = parse_si_float(line[start:pos].lstrip("(),"))
+            if v is not None:
+                return v
+        pos = line.find("/s", pos + 2)
 
     return None
 
 
+_SI_MULTIPLIERS: Final[dict[str, float]] = {
+    "k": 1_000.0,
+    "K": 1_000.0,
+    "m": 1_000_000.0,
+    "M": 1_000_000.0,
+    "g": 1_000_000_000.0,
+    "G": 1_000_000_000.0,
+}
+
+
 def parse_si_float(token: str) -> float | None:
     """
     Parse a float that may have SI suffixes:
@@ -720,18 +832,11 @@ def parse_si_float(token: str) -> float | None:
     if not t:
         return None
 
-    last = t[-1]
-    if last in {"k", "K"}:
-        num, mul = t[:-1], 1_000.0
-    elif last in {"m", "M"}:
-        num, mul = t[:-1], 1_000_000.0
-    elif last in {"g", "G"}:
-        num, mul = t[:-1], 1_000_000_000.0
-    else:
-        num, mul = t, 1.0
+    mul = _SI_MULTIPLIERS.get(t[-1])
+    num = t if mul is None else t[:-1]
 
     try:
-        return float(num) * mul
+        return float(num) * (1.0 if mul is None else mul)
     except ValueError:
         return None
 
@@ -784,27 +889,56 @@ def parse_k6_completed_iterations(line: str) -> int | None:
 
     Handles commas in the number.
     """
-    prev: str | None = None
-    for tok in line.split():
-        if tok == "complete":
-            if prev is None:
+    pos = line.find("complete")
+    while pos != -1:
+        end = pos + len("complete")
+        if (pos == 0 or line[pos - 1].isspace()) and (end == len(line) or line[end].isspace()):
+            before = line[:pos].rsplit(None, 1)
+            if not before:
                 return None
-            n = prev.rstrip(",").replace(",", "")
+            # str.replace hands back the same string when there is no comma to drop.
+            n = before[-1].rstrip(",").replace(",", "")
             try:
                 return int(n)
             except ValueError:
                 return None
-        prev = tok
+        pos = line.find("complete", end)
     return None
 
 
-def tail_lines(text: str, n: int) -> str:
+def tail_lines(text: str, n: int, *, max_chars: int | None = None) -> str:
+    """Last `n` lines of `text`; with `max_chars`, capped like `truncate` without copying more."""
     if n <= 0:
         return ""
-    lines = text.splitlines()
-    if len(lines) <= n:
-        return text
-    return "\n".join(lines[-n:])
+    # Walk back over the last `n` newlines instead of splitting the whole (possibly huge)
+    # capture. A trailing newline terminates the last line rather than starting a new one.
+    end = len(text) - 1 if text.endswith("\n") else len(text)
+    start = end
+    for _ in range(n):
+        start = text.rfind("\n", 0, start)
+        if start < 0:
+            start, end = 0, len(text)
+            break
+    else:
+        start += 1
+    if max_chars is not None and end - start > max_chars:
+        return text[start : start + max_chars] + "..." if max_chars > 0 else ""
+    return text[start:end]
+
+
+def _diag_tail(text: str) -> str:
+    return tail_lines(text, _DIAG_TAIL_LINES, max_chars=_DIAG_MAX_CHARS)
+
+
+def _diagnosed_error(kind: str, message: str, *, stdout: str, stderr: str) -> ParseError:
+    """A ParseError for `message` with the tails of both output streams attached."""
+    diag = ParseDiagnostics(
+        kind=kind,
+        message=message,
+        stdout_tail=_diag_tail(stdout),
+        stderr_tail=_diag_tail(stderr),
+    )
+    return ParseError(diag.format())
 
 
 def truncate(text: str, max_chars: int) -> str:
@@ -1,8 +1,83 @@
 from __future__ import annotations
 
-from .exec import RunResult
+from dataclasses import dataclass
+from typing import Literal
+
+from wrkr_tools_common.exec import RunResult
+
 from .parse import Rps
 
+type SummaryKind = Literal["header", "dim", "rps", "ratio", "plain"]
+type SummaryStatus = Literal["OK", "FAIL", "SKIP"]
+
+
+@dataclass(frozen=True, slots=True)
+class SummaryLine:
+    """
+    One line of the end-of-run summary block.
+
+    The text is rendered as-is; the spans mark the parts the UI colors, so nothing has to
+    re-parse the text to find them.
+    """
+
+    text: str
+    kind: SummaryKind = "plain"
+    status: SummaryStatus | None = None
+    status_span: tuple[int, int] | None = None
+    rps_spans: tuple[tuple[int, int], ...] = ()
+    ratio_span: tuple[int, int] | None = None
+    ratio_ok: float | None = None
+    ratio_actual: float | None = None
+
+
+def summary_header(text: str) -> SummaryLine:
+    return SummaryLine(text=text, kind="header")
+
+
+def summary_dim(text: str) -> SummaryLine:
+    return SummaryLine(text=text, kind="dim")
+
+
+def summary_tool_line(
+    label: str, status: SummaryStatus, rps: Rps | None = None, *, with_rps: bool = True
+) -> SummaryLine:
+    """Format `  <label>: <status> rps=<value>` (`with_rps=False` drops the rps part)."""
+    head = f"  {label}: "
+    status_span = (len(head), len(head) + len(status))
+    if not with_rps:
+        return SummaryLine(text=head + status, status=status, status_span=status_span)
+
+    prefix = f"{head}{status} rps="
+    value = _fmt_rps(rps)
+    return SummaryLine(
+        text=prefix + value,
+        kind="rps",
+        status=status,
+        status_span=status_span,
+        rps_spans=((len(prefix), len(prefix) + len(value)),),
+    )
+
+
+def summary_gate_line(label: str, *, ratio_ok: float, ratio_actual: float) -> SummaryLine:
+    prefix = f"  gate {label}: ratio_ok={ratio_ok} ratio_actual="
+    value = f"{ratio_actual:.3f}"
+    return SummaryLine(
+        text=prefix + value,
+        kind="ratio",
+        ratio_span=(len(prefix), len(prefix) + len(value)),
+        ratio_ok=ratio_ok,
+        ratio_actual=ratio_actual,
+    )
+
+
+def summary_gate_skipped(label: str) -> SummaryLine:
+    head = f"  gate {label}: "
+    return SummaryLine(
+        text=f"{head}SKIP (correctness failed or missing tool)",
+        status="SKIP",
+        status_span=(len(head), len(head) + len("SKIP")),
+    )
+
 
 def _mb_from_bytes(n: int) -> float:
     return float(n) / 1024.0 / 1024.0
@@ -54,6 +129,14 @@ def format_grpc_summary_line(
 
 
 __all__ = [
+    "SummaryKind",
+    "SummaryLine",
+    "SummaryStatus",
     "format_grpc_summary_line",
     "format_http_summary_line",
+    "summary_dim",
+    "summary_gate_line",
+    "summary_gate_skipped",
+    "summary_header",
+    "summary_tool_line",
 ]
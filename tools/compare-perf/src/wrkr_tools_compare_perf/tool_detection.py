@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import shutil
 from dataclasses import dataclass
@@ -27,39 +28,48 @@ class ToolPaths:
     wrkr_testserver: Path
 
 
-def detect_tools(root: Path, requirements: ToolRequirements) -> ToolPaths:
-    """Detect required binaries and optional external tools.
+def detect_server_bin(root: Path) -> Path:
+    """Locate the built `wrkr-testserver` binary.
+
+    This is split out so the server can be launched before the remaining tools are probed.
+    `root` must be an existing, resolved path (the app validates it once up front).
+
+    Raises
+    ------
+    ToolDetectionError
+        If the binary has not been built.
+    """
+    wrkr_testserver = root / "target" / "release" / exe_name("wrkr-testserver")
+    if not wrkr_testserver.exists():
+        raise ToolDetectionError(
+            f"Missing binary: {wrkr_testserver} (build first or pass --build so it can be built automatically)"
+        )
+    return wrkr_testserver
+
+
+def detect_load_tools(root: Path, requirements: ToolRequirements, *, server_bin: Path) -> ToolPaths:
+    """Detect the load generators (`wrkr`, and `wrk`/`k6` on PATH).
 
     Parameters
     ----------
     root:
-        wrkr repository root directory.
+        wrkr repository root directory, already resolved (see `detect_server_bin`).
     requirements:
         Whether `wrk` and/or `k6` are required.
-
-    Returns
-    -------
-    ToolPaths
+    server_bin:
+        The `wrkr-testserver` binary from `detect_server_bin`.
 
     Raises
     ------
     ToolDetectionError
         If required binaries/tools are missing.
     """
-    root = root.resolve()
-
-    wrkr = root / "target" / "release" / _exe_name("wrkr")
+    wrkr = root / "target" / "release" / exe_name("wrkr")
     if not wrkr.exists():
         raise ToolDetectionError(
             f"Missing binary: {wrkr} (build first or pass --build so it can be built automatically)"
         )
 
-    wrkr_testserver = root / "target" / "release" / _exe_name("wrkr-testserver")
-    if not wrkr_testserver.exists():
-        raise ToolDetectionError(
-            f"Missing binary: {wrkr_testserver} (build first or pass --build so it can be built automatically)"
-        )
-
     wrk = _which("wrk")
     if requirements.require_wrk and wrk is None:
         raise ToolDetectionError("Missing required command: wrk (not found on PATH)")
@@ -72,11 +82,11 @@ def detect_tools(root: Path, requirements: ToolRequirements) -> ToolPaths:
         wrk=wrk,
         k6=k6,
         wrkr=wrkr,
-        wrkr_testserver=wrkr_testserver,
+        wrkr_testserver=server_bin,
     )
 
 
-def _exe_name(base: str) -> str:
+def exe_name(base: str) -> str:
     """Return platform-specific executable name."""
     if os.name == "nt" and not base.lower().endswith(".exe"):
         return f"{base}.exe"
@@ -85,7 +95,13 @@ def _exe_name(base: str) -> str:
 
 def _which(cmd: str) -> Path | None:
     """Find an executable on PATH."""
-    found = shutil.which(cmd)
+    return _which_on_path(cmd, os.environ.get("PATH"))
+
+
+@functools.lru_cache(maxsize=16)
+def _which_on_path(cmd: str, path: str | None) -> Path | None:
+    # Keyed on PATH as well, so a changed PATH is searched afresh.
+    found = shutil.which(cmd, path=path)
     if not found:
         return None
     return Path(found)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import sys
+import threading
 import time
 from collections import deque
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
@@ -20,9 +21,11 @@ from rich.progress import (
 )
 from rich.text import Text
 
+from .config import ColorMode
 
-def _console_for_color_mode(color: str) -> Console:
-    mode = color.strip().lower()
+
+def _console_for_color_mode(mode: ColorMode) -> Console:
+    # `mode` is already normalized (see `config.parse_color_mode`).
     if mode == "always":
         # Emit ANSI color codes even when stdout is not a TTY (useful for piping to `tail`).
         return Console(force_terminal=True)
@@ -30,7 +33,14 @@ def _console_for_color_mode(color: str) -> Console:
         return Console(no_color=True)
     if mode == "auto":
         return Console()
-    raise ValueError(f"Invalid color mode: {color!r} (expected auto|always|never)")
+    raise ValueError(f"Invalid color mode: {mode!r} (expected auto|always|never)")
+
+
+def _styled_text(message: str, style: str | None) -> Text:
+    text = Text(message)
+    if style is not None:
+        text.stylize(style)
+    return text
 
 
 def _is_interactive_default() -> bool:
@@ -58,17 +68,32 @@ class RunUI:
       progress bars + current command + last N tail lines.
     - If stdout is not a TTY: prints only high-level log lines (no spam);
       subprocess output is kept in an in-memory tail buffer.
+
+    All methods are safe to call from multiple threads (subprocess reader threads and
+    concurrently running cases share one UI). With concurrent cases the step line lists every
+    in-flight step, while the command line only shows the most recently started command.
     """
 
-    def __init__(self, *, tail_lines: int = 10, color: str = "auto") -> None:
+    def __init__(self, *, tail_lines: int = 10, color: ColorMode = "auto") -> None:
         self.console = _console_for_color_mode(color)
         self._live_enabled = _is_interactive_default()
 
-        self._tail = deque(maxlen=tail_lines)
+        # Re-entrant: `log()` delegates to `tail()`, and both end in `_refresh()`.
+        self._lock = threading.RLock()
+
+        # Raw `(message, style)` pairs; `Text` is only built when the tail is rendered.
+        self._tail: deque[tuple[str, str | None]] = deque(maxlen=tail_lines)
         self._current_cmd: CommandInfo | None = None
 
         self._status: Mapping[str, str] | None = None
 
+        # Rendered status/command lines, rebuilt only after their setters run.
+        self._status_text: Text | None = None
+        self._command_text: Text | None = None
+        # Set whenever the status, command or tail changes; the progress bars render themselves
+        # on Live's own refresh, so a clean UI needs no `Live.update()`.
+        self._dirty = True
+
         self._overall = Progress(
             TextColumn("[bold]overall[/bold]"),
             BarColumn(bar_width=None),
@@ -87,6 +112,8 @@ class RunUI:
             transient=False,
         )
         self._step_task_id = self._step.add_task("idle", total=None)
+        # Titles of the steps currently running, in start order (cases may run concurrently).
+        self._active_steps: list[str] = []
 
         self._live: Live | None = None
         self._last_refresh_s = 0.0
@@ -96,16 +123,21 @@ class RunUI:
         return self._live_enabled
 
     def set_total_steps(self, total: int) -> None:
-        self._overall.update(self._overall_task_id, total=total, completed=0)
-        self._refresh()
+        """Set the overall step count. Steps already completed are kept."""
+        with self._lock:
+            self._overall.update(self._overall_task_id, total=total)
+            self._refresh()
 
     def set_status(self, values: Mapping[str, str]) -> None:
-        self._status = values
-        if not self._live_enabled:
-            # Keep it single-line and grep-friendly.
-            parts = " ".join(f"{k}={v}" for k, v in values.items())
-            self.console.print(f"STATUS {parts}")
-        self._refresh()
+        with self._lock:
+            self._status = values
+            self._status_text = None
+            self._dirty = True
+            if not self._live_enabled:
+                # Keep it single-line and grep-friendly.
+                parts = " ".join(f"{k}={v}" for k, v in values.items())
+                self.console.print(f"STATUS {parts}")
+            self._refresh()
 
     def start(self) -> None:
         if not self._live_enabled:
@@ -113,36 +145,47 @@ class RunUI:
         # Keep refresh relatively low to avoid spamming terminals that don't handle
         # cursor rewrites well (e.g. some VS Code terminal configurations).
         self._live = Live(self._render(), console=self.console, refresh_per_second=4)
+        self._dirty = False
         self._live.start()
 
     def stop(self) -> None:
-        if self._live is None:
-            return
+        with self._lock:
+            if self._live is None:
+                return
 
-        total = self._overall.tasks[self._overall_task_id].total
-        if total is not None:
-            self._overall.update(self._overall_task_id, completed=total)
-            self._refresh()
+            total = self._overall.tasks[self._overall_task_id].total
+            if total is not None:
+                self._overall.update(self._overall_task_id, completed=total)
+                self._refresh()
 
-        self._live.stop()
-        self._live = None
+            self._live.stop()
+            self._live = None
 
     def _refresh(self) -> None:
-        if self._live is None:
+        if self._live is None or not self._dirty:
             return
         now = time.monotonic()
         if (now - self._last_refresh_s) < 0.20:
             return
         self._last_refresh_s = now
+        self._dirty = False
         self._live.update(self._render())
 
     def tail(self, message: str, *, style: str | None = None) -> None:
         """Append to the rolling tail buffer. Does not print in non-TTY mode."""
-        msg = Text(message)
-        if style is not None:
-            msg.stylize(style)
-        self._tail.append(msg)
-        self._refresh()
+        with self._lock:
+            self._tail.append((message, style))
+            self._dirty = True
+            self._refresh()
+
+    def tail_many(self, messages: Sequence[str], *, style: str | None = None) -> None:
+        """Append a batch of lines to the tail buffer with a single refresh."""
+        # Lines that would be evicted by the bounded deque right away are never rendered.
+        keep = messages if self._tail.maxlen is None else messages[-self._tail.maxlen :]
+        with self._lock:
+            self._tail.extend((m, style) for m in keep)
+            self._dirty = True
+            self._refresh()
 
     def log(self, message: str, *, style: str | None = None) -> None:
         """High-level log line (prints in non-TTY, shows in tail in TTY)."""
@@ -150,11 +193,33 @@ class RunUI:
             self.tail(message, style=style)
             return
 
-        text = Text(message)
-        if style is not None:
-            text.stylize(style)
-        self.console.print(text)
-        self._tail.append(text)
+        with self._lock:
+            self.console.print(_styled_text(message, style))
+            self._tail.append((message, style))
+
+    @contextmanager
+    def batched_log(self) -> Iterator[Callable[..., None]]:
+        """
+        Queue `log()` lines and emit them together when the block exits.
+
+        The yielded function takes the same arguments as `log()`. The queued lines cost a single
+        console write (non-TTY) or a single refresh (TTY) instead of one per line.
+        """
+        pending: list[tuple[str, str | None]] = []
+
+        def queue(message: str, *, style: str | None = None) -> None:
+            pending.append((message, style))
+
+        try:
+            yield queue
+        finally:
+            if pending:
+                with self._lock:
+                    if not self._live_enabled:
+                        self.console.print(Text("\n").join(_styled_text(m, s) for m, s in pending))
+                    self._tail.extend(pending)
+                    self._dirty = True
+                    self._refresh()
 
     def set_current_command(
         self,
@@ -164,38 +229,53 @@ class RunUI:
         cwd: Path | None,
         env: Mapping[str, str] | None,
     ) -> None:
-        self._current_cmd = CommandInfo(
+        cmd = CommandInfo(
             label=label,
             argv=[str(a) for a in argv],
             cwd=cwd,
             env=env,
         )
-        if self._live_enabled:
-            self._refresh()
-        else:
-            # Docker/CI-friendly: print command once when it changes.
-            cmd = self._current_cmd
-            argv = " ".join(cmd.argv)
-            self.console.print(Text(f"cmd[{cmd.label}]: ", style="bold") + Text(argv))
+        with self._lock:
+            self._current_cmd = cmd
+            self._command_text = None
+            self._dirty = True
+            if self._live_enabled:
+                self._refresh()
+            else:
+                # Docker/CI-friendly: print command once when it changes.
+                line = " ".join(cmd.argv)
+                self.console.print(Text(f"cmd[{cmd.label}]: ", style="bold") + Text(line))
 
     @contextmanager
     def step(self, title: str) -> Iterable[None]:
         if not self._live_enabled:
-            self.console.print(Text("==> ", style="bold cyan") + Text(title))
+            with self._lock:
+                self.console.print(Text("==> ", style="bold cyan") + Text(title))
             try:
                 yield
             finally:
-                self.console.print(Text("<== ", style="bold cyan") + Text(title))
+                with self._lock:
+                    self.console.print(Text("<== ", style="bold cyan") + Text(title))
             return
 
-        self._step.update(self._step_task_id, description=title)
-        self._refresh()
+        # The lock is never held across `yield`: the step body runs subprocesses whose
+        # reader threads call back into `tail()`.
+        with self._lock:
+            self._active_steps.append(title)
+            self._update_step_description()
+            self._refresh()
         try:
             yield
         finally:
-            self._overall.advance(self._overall_task_id, 1)
-            self._step.update(self._step_task_id, description="idle")
-            self._refresh()
+            with self._lock:
+                self._overall.advance(self._overall_task_id, 1)
+                self._active_steps.remove(title)
+                self._update_step_description()
+                self._refresh()
+
+    def _update_step_description(self) -> None:
+        description = " | ".join(self._active_steps) if self._active_steps else "idle"
+        self._step.update(self._step_task_id, description=description)
 
     def _render(self) -> Group:
         status = self._render_status()
@@ -204,12 +284,20 @@ class RunUI:
         return Group(status, self._overall, self._step, cmd, tail)
 
     def _render_status(self) -> Text:
-        if not self._status:
-            return Text("STATUS -", style="dim")
-        parts = " ".join(f"{k}={v}" for k, v in self._status.items())
-        return Text(f"STATUS {parts}")
+        if self._status_text is None:
+            if not self._status:
+                self._status_text = Text("STATUS -", style="dim")
+            else:
+                parts = " ".join(f"{k}={v}" for k, v in self._status.items())
+                self._status_text = Text(f"STATUS {parts}")
+        return self._status_text
 
     def _render_command(self) -> Text:
+        if self._command_text is None:
+            self._command_text = self._build_command_text()
+        return self._command_text
+
+    def _build_command_text(self) -> Text:
         if self._current_cmd is None:
             return Text("CMD -", style="dim")
 
@@ -224,5 +312,5 @@ class RunUI:
             return Text("TAIL (empty)", style="dim")
 
         body = Text("TAIL\n", style="bold")
-        body.append(Text("\n").join(self._tail))
+        body.append(Text("\n").join(_styled_text(m, s) for m, s in self._tail))
         return body
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from wrkr_tools_compare_perf.build import _build_fingerprint
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("x", encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_build_fingerprint_tracks_sources_and_binaries(tmp_path: Path) -> None:
+    (tmp_path / "Cargo.toml").write_text('[workspace]\nmembers = ["crate"]\n', encoding="utf-8")
+    os.utime(tmp_path / "Cargo.toml", ns=(1_000, 1_000))
+    (tmp_path / "Cargo.lock").write_text("lock", encoding="utf-8")
+    _touch(tmp_path / "crate" / "src" / "main.rs", 1_000)
+    _touch(tmp_path / "target" / "release" / "wrkr", 2_000)
+    _touch(tmp_path / "target" / "release" / "wrkr-testserver", 2_000)
+
+    before = _build_fingerprint(tmp_path, None)
+    assert before == _build_fingerprint(tmp_path, None)
+    assert before != _build_fingerprint(tmp_path, "-C target-cpu=native")
+
+    # Files under a member's target/ dir are build outputs, not inputs.
+    _touch(tmp_path / "crate" / "target" / "junk", 5_000)
+    assert before == _build_fingerprint(tmp_path, None)
+
+    _touch(tmp_path / "crate" / "src" / "main.rs", 3_000)
+    assert before != _build_fingerprint(tmp_path, None)
+
+
+def test_build_fingerprint_tracks_path_dependencies_and_glob_members(tmp_path: Path) -> None:
+    (tmp_path / "Cargo.toml").write_text(
+        '[workspace]\nmembers = ["app", "crates/*"]\n', encoding="utf-8"
+    )
+    # `http` is not a workspace member; `app` only reaches it through a path dependency.
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "Cargo.toml").write_text(
+        '[dependencies]\nhttp = { path = "../http", optional = true }\n', encoding="utf-8"
+    )
+    (tmp_path / "http").mkdir()
+    (tmp_path / "http" / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+    (tmp_path / "crates" / "util").mkdir(parents=True)
+    (tmp_path / "crates" / "util" / "Cargo.toml").write_text("[package]\n", encoding="utf-8")
+    for manifest in tmp_path.rglob("Cargo.toml"):
+        os.utime(manifest, ns=(1_000, 1_000))
+    _touch(tmp_path / "http" / "src" / "lib.rs", 1_000)
+    _touch(tmp_path / "crates" / "util" / "src" / "lib.rs", 1_000)
+
+    before = _build_fingerprint(tmp_path, None)
+
+    _touch(tmp_path / "http" / "src" / "lib.rs", 3_000)
+    after_dep = _build_fingerprint(tmp_path, None)
+    assert after_dep != before
+
+    _touch(tmp_path / "crates" / "util" / "src" / "lib.rs", 4_000)
+    assert _build_fingerprint(tmp_path, None) != after_dep
+
+
+def test_build_fingerprint_tracks_protoc(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PROTOC", raising=False)
+    before = _build_fingerprint(tmp_path, None)
+    monkeypatch.setenv("PROTOC", "/opt/protoc/bin/protoc")
+    assert _build_fingerprint(tmp_path, None) != before
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from wrkr_tools_common.exec import RunResult
+from wrkr_tools_compare_perf.cache import load_run, run_cache_key, store_run
+
+
+def test_run_cache_key_ignores_url_and_tracks_inputs(tmp_path: Path) -> None:
+    script = tmp_path / "hello.lua"
+    script.write_text("-- v1", encoding="utf-8")
+    binary = tmp_path / "wrk"
+    binary.touch()
+
+    def key(url: str, argv_extra: str = "-d5s", *, contended: bool = False) -> str | None:
+        return run_cache_key(
+            label="wrk",
+            argv=[str(binary), argv_extra, "-s", str(script), url],
+            url=url,
+            script=script,
+            binaries=(binary,),
+            contended=contended,
+        )
+
+    k1 = key("http://127.0.0.1:1111/")
+    assert k1 is not None
+    assert key("http://127.0.0.1:2222/") == k1
+    assert key("http://127.0.0.1:1111/", "-d10s") != k1
+    # Runs measured alongside other load generators must not be replayed into sequential runs.
+    assert key("http://127.0.0.1:1111/", contended=True) != k1
+
+    script.write_text("-- v2", encoding="utf-8")
+    assert key("http://127.0.0.1:1111/") != k1
+
+    k2 = key("http://127.0.0.1:1111/")
+    (tmp_path / "protos").mkdir()
+    proto = tmp_path / "protos" / "echo.proto"
+    proto.write_text('syntax = "proto3";', encoding="utf-8")
+    k3 = key("http://127.0.0.1:1111/")
+    assert k3 != k2
+    proto.write_text('syntax = "proto3"; package echo;', encoding="utf-8")
+    assert key("http://127.0.0.1:1111/") != k3
+
+    os.utime(binary, ns=(1_000, 1_000))
+    script.unlink()
+    assert key("http://127.0.0.1:1111/") is None
+
+
+def test_store_and_load_run_round_trip(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    ok = RunResult(returncode=0, stdout="out\n", stderr="", peak_rss_bytes=42)
+    failed = RunResult(returncode=1, stdout="", stderr="boom\n", peak_rss_bytes=1)
+
+    assert load_run("k") is None
+    store_run("k", ok)
+    store_run("f", failed)
+
+    assert load_run("k") == ok
+    assert load_run("f") is None
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from wrkr_tools_compare_perf.cases import (
+    _format_wrkr_json_progress_line_for_ui,
+    _gate,
+    _no_proxy_env_for_localhost,
+    _tool_summary_lines,
+)
+from wrkr_tools_compare_perf.parse import Rps
+from wrkr_tools_compare_perf.ui import RunUI
+
+
+def _fixture_lines(name: str) -> list[str]:
+    p = Path(__file__).parent / "fixtures" / name
+    return p.read_text(encoding="utf-8").splitlines()
+
+
+def test_format_wrkr_progress_line_v1() -> None:
+    progress, *_ = _fixture_lines("wrkr_json_stdout.ndjson")
+
+    assert _format_wrkr_json_progress_line_for_ui(progress) == (
+        "wrkr: t=  1.00s rps_avg=   100.000 p99=   4.000ms mean=   1.200ms "
+        "failed_checks=0 total=100"
+    )
+
+
+def test_format_wrkr_progress_line_skips_non_progress() -> None:
+    summary = _fixture_lines("wrkr_json_stdout.ndjson")[-1]
+
+    assert _format_wrkr_json_progress_line_for_ui(summary) is None
+    assert _format_wrkr_json_progress_line_for_ui("Running 5s test") is None
+    assert _format_wrkr_json_progress_line_for_ui('{"elapsedSeconds": oops') is None
+
+
+def test_format_wrkr_progress_line_legacy() -> None:
+    line = (
+        '{"elapsed_secs":2,"total_requests":50,"req_per_sec_avg":25.0,'
+        '"latency_p99":7,"latency_mean":1.5,"checks_failed_total":0}'
+    )
+
+    assert _format_wrkr_json_progress_line_for_ui(line) == (
+        "wrkr: t=  2s rps_avg=    25.000 p99=   7ms mean=  1.500ms failed_checks=0 total=50"
+    )
+
+
+def test_tool_summary_lines_grpc_without_k6() -> None:
+    lines = _tool_summary_lines(
+        header="gRPC unary",
+        scripts="wrkr=a.lua k6=b.js",
+        duration="5s",
+        wrk=None,
+        wrkr=("OK", Rps(10.0)),
+        wrkr_json=None,
+        k6=("SKIP", None),
+    )
+
+    assert [line.text for line in lines] == [
+        "gRPC unary",
+        "  scripts: wrkr=a.lua k6=b.js duration=5s",
+        "  wrkr: OK rps=10.000",
+        "  k6  : SKIP",
+    ]
+
+
+def test_no_proxy_env_merges_localhost_without_duplicates(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("NO_PROXY", "example.com, localhost,,example.com")
+    _no_proxy_env_for_localhost.cache_clear()
+    try:
+        env = _no_proxy_env_for_localhost()
+    finally:
+        _no_proxy_env_for_localhost.cache_clear()
+
+    assert env["NO_PROXY"] == "example.com,localhost,127.0.0.1,::1"
+    assert env["no_proxy"] == env["NO_PROXY"]
+
+
+def test_gate_inclusive_passes_at_threshold_and_strict_fails(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    ui = RunUI(color="never")
+    wrkr, other = Rps(90.0), Rps(100.0)
+
+    line, failure = _gate(
+        "wrk", case="HTTP hello", wrkr=wrkr, other=other, ratio=0.9, inclusive=True, ui=ui
+    )
+    assert failure is None
+    assert line.text == "  gate wrkr/wrk: ratio_ok=0.9 ratio_actual=0.900"
+
+    line, failure = _gate(
+        "k6", case="HTTP hello", wrkr=wrkr, other=other, ratio=0.9, inclusive=False, ui=ui
+    )
+    assert failure == "FAIL: wrkr is too slow vs k6 (ratio_ok=0.9, ratio_actual=0.900)"
+    assert line.text == "  gate wrkr/k6 : ratio_ok=0.9 ratio_actual=0.900"
+    assert capsys.readouterr().out.splitlines() == [
+        "HTTP hello: PASS: wrkr/wrk >= 0.9 (ratio_actual=0.900)",
+        "HTTP hello: FAIL: wrkr is too slow vs k6 (ratio_ok=0.9, ratio_actual=0.900)",
+    ]
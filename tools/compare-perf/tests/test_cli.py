@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from wrkr_tools_compare_perf.cli import _RATIO_OPTIONS
+from wrkr_tools_compare_perf.config import Ratios
+
+
+def test_cli_import_defers_the_runner() -> None:
+    # Run in a fresh interpreter: other tests may already have imported `.app`.
+    code = (
+        "import sys\n"
+        "import wrkr_tools_compare_perf.cli as cli\n"
+        "assert 'wrkr_tools_compare_perf.app' not in sys.modules\n"
+        "from wrkr_tools_compare_perf.app import run\n"
+        "assert cli.run_suite is run\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_ratio_options_cover_every_ratio_field() -> None:
+    assert tuple(_RATIO_OPTIONS) == Ratios._fields
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
-from wrkr_tools_compare_perf.config import ConfigError, env_bool, parse_duration_to_seconds
+from wrkr_tools_compare_perf.app import config_from_values
+from wrkr_tools_compare_perf.config import (
+    Config,
+    ConfigError,
+    Ratios,
+    RunTuning,
+    env_bool,
+    env_float,
+    env_int,
+    parse_color_mode,
+    parse_duration_to_seconds,
+    validate_ratios,
+    validate_tuning,
+)
 
 
 @pytest.mark.parametrize(
@@ -13,15 +28,32 @@ from wrkr_tools_compare_perf.config import ConfigError, env_bool, parse_duration
         ("2.5s", 2.5),
         ("1m", 60.0),
         ("  5s ", 5.0),
+        ("5 ms", 0.005),
     ],
 )
 def test_parse_duration_to_seconds(value: str, expected: float) -> None:
     assert parse_duration_to_seconds(value) == expected
 
 
-def test_parse_duration_to_seconds_rejects_invalid() -> None:
+@pytest.mark.parametrize(
+    "value", ["5", "s", "-5s", "+5s", "1e3ms", "infs", "1_0s", "5.s", ".5s", "5x"]
+)
+def test_parse_duration_to_seconds_rejects_invalid(value: str) -> None:
     with pytest.raises(ConfigError):
-        parse_duration_to_seconds("5")
+        parse_duration_to_seconds(value)
+
+
+def test_parse_duration_to_seconds_memoizes_only_valid_values() -> None:
+    parse_duration_to_seconds.cache_clear()
+    assert parse_duration_to_seconds("3s") == 3.0
+    assert parse_duration_to_seconds("3s") == 3.0
+    assert parse_duration_to_seconds.cache_info().hits == 1
+
+    # Errors are never cached: a bad value fails on every call.
+    for _ in range(2):
+        with pytest.raises(ConfigError):
+            parse_duration_to_seconds("3")
+    assert parse_duration_to_seconds.cache_info().currsize == 1
 
 
 def test_env_bool_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -35,6 +67,64 @@ def test_env_bool_parsing(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("X", "0")
     assert env_bool("X", default=True) is False
 
+    monkeypatch.setenv("X", " ON ")
+    assert env_bool("X", default=False) is True
+
     monkeypatch.setenv("X", "wat")
     with pytest.raises(ConfigError):
         env_bool("X", default=True)
+
+
+def test_env_int_and_float_treat_blank_as_unset(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("X", raising=False)
+    assert env_int("X") is None
+
+    monkeypatch.setenv("X", "   ")
+    assert env_int("X") is None
+    assert env_float("X") is None
+
+    monkeypatch.setenv("X", " 42 ")
+    assert env_int("X") == 42
+    assert env_float("X") == 42.0
+
+    monkeypatch.setenv("X", "4x")
+    with pytest.raises(ConfigError):
+        env_int("X")
+
+
+def test_validate_tuning_rejects_non_positive_parallel_cases() -> None:
+    validate_tuning(RunTuning(parallel_cases=4))
+    with pytest.raises(ConfigError):
+        validate_tuning(RunTuning(parallel_cases=0))
+
+
+def test_config_renders_display_strings_once() -> None:
+    cfg = Config(root=Path("."), tuning=RunTuning(wrkr_vus=32, wrk_threads=2, wrk_connections=64))
+
+    assert cfg.status_wrk_str == "threads=2 conns=64"
+    assert cfg.status_wrkr_str == "vus=32"
+    assert cfg.status_k6_str == "vus=32"
+    assert cfg.conditions_load_str == "wrkr_vus=32 k6_vus=32 wrk_threads=2 wrk_connections=64"
+
+
+def test_validate_ratios_names_the_offending_gate() -> None:
+    validate_ratios(Ratios())
+    with pytest.raises(ConfigError, match="ratio_ok_grpc_wrkr_over_wrk_hello must be > 0"):
+        validate_ratios(Ratios(ratio_ok_grpc_wrkr_over_wrk_hello=0.0))
+
+
+def test_parse_color_mode_normalizes_and_rejects_unknown() -> None:
+    assert parse_color_mode(" Always ") == "always"
+    assert parse_color_mode("never") == "never"
+    with pytest.raises(ConfigError, match="Invalid --color value"):
+        parse_color_mode("sometimes")
+
+
+def test_config_from_values_maps_every_ratio_and_requirement() -> None:
+    names = Ratios._fields
+    values = {name: 0.5 + i for i, name in enumerate(names)}
+    cfg = config_from_values(root=Path("/r"), require_wrk=True, require_k6=False, **values)
+
+    assert cfg.ratios._asdict() == values
+    assert cfg.requirements.require_wrk is True
+    assert cfg.requirements.require_k6 is False
@@ -6,10 +6,17 @@ import pytest
 
 from wrkr_tools_compare_perf.parse import (
     ParseError,
+    _iter_lines_reversed,
+    _parse_k6_pct_fraction,
     detect_wrk_errors,
+    parse_k6_completed_iterations,
     parse_k6_http_rps,
+    parse_slash_s_token,
     parse_wrk_rps,
     parse_wrkr_rps,
+    scan_k6_output,
+    scan_wrk_output,
+    tail_lines,
     try_parse_wrkr_json_summary,
 )
 
@@ -31,6 +38,22 @@ def test_detect_wrk_errors_non_2xx_and_socket_errors() -> None:
     assert "wrk socket read: 12" in errs
 
 
+def test_scan_wrk_output_collects_rps_and_errors_in_one_pass() -> None:
+    signals = scan_wrk_output(_read_fixture("wrk_errors_stdout.txt"))
+    assert signals.rps is not None
+    assert signals.rps.value == pytest.approx(1000.0)
+    assert signals.rps_error is None
+    assert signals.errors == ("wrk non-2xx/3xx responses: 2", "wrk socket read: 12")
+
+
+def test_scan_wrk_output_reports_missing_rps() -> None:
+    signals = scan_wrk_output("Running 5s test @ http://127.0.0.1:1\n")
+    assert signals.rps is None
+    assert signals.rps_error is not None and "no 'Requests/sec:' line" in signals.rps_error
+    with pytest.raises(ParseError, match="Requests/sec"):
+        parse_wrk_rps("Running 5s test @ http://127.0.0.1:1\n")
+
+
 def test_parse_k6_http_rps_from_http_reqs() -> None:
     out = _read_fixture("k6_http_stdout.txt")
     rps = parse_k6_http_rps(stdout=out, stderr="")
@@ -42,6 +65,37 @@ def test_parse_k6_http_rps_raises_on_unparseable() -> None:
         parse_k6_http_rps(stdout="nope", stderr="")
 
 
+def test_scan_k6_output_collects_all_signals_in_one_pass() -> None:
+    out = _read_fixture("k6_http_stdout.txt")
+    err = (
+        'time="..." level=warning msg="Request Failed" error="EOF"\n'
+        "     grpc_req_failed................: 1.50%  ✓ 3        ✗ 197\n"
+        'time="..." level=warning msg="Request Failed" error="EOF"\n'
+    )
+
+    sig = scan_k6_output(stdout=out, stderr=err)
+
+    assert sig.http_rps is not None
+    assert sig.http_rps.value == pytest.approx(217130.6)
+    # No grpc_reqs line: iterations is used, as in parse_k6_grpc_rps.
+    assert sig.grpc_rps is not None
+    assert sig.grpc_rps.value == pytest.approx(217130.6)
+    assert sig.http_req_failed == 0.0
+    assert sig.grpc_req_failed == pytest.approx(0.015)
+    assert sig.request_failed_warnings == 2
+
+
+def test_scan_k6_output_falls_back_to_progress_lines() -> None:
+    out = "running (02.0s), 000/256 VUs, 1,000 complete and 0 interrupted iterations\n"
+
+    sig = scan_k6_output(stdout=out, stderr="")
+
+    assert sig.http_rps is not None
+    assert sig.http_rps.value == pytest.approx(500.0)
+    assert sig.http_req_failed is None
+    assert sig.grpc_req_failed is None
+
+
 def test_parse_wrkr_rps_from_json_ndjson() -> None:
     out = _read_fixture("wrkr_json_stdout.ndjson")
     rps = parse_wrkr_rps(stdout=out, stderr="")
@@ -60,6 +114,18 @@ def test_parse_wrkr_rps_prefers_summary_totals_when_duration_is_provided() -> No
     assert rps_duration.value == pytest.approx(120.0)
 
 
+def test_parse_wrkr_rps_text_fallback() -> None:
+    summary = (
+        "  http_reqs......: 500 (100.0/s)\n"
+        "  grpc_reqs......: 1000 (200.0/s)\n"
+        "  iterations.....: 1000 (200.0/s)\n"
+    )
+    assert parse_wrkr_rps(stdout=summary, stderr="").value == pytest.approx(200.0)
+    # A legacy `rps:` line wins over the summary wherever it appears.
+    legacy = parse_wrkr_rps(stdout="", stderr=summary + "rps: 321.5\n")
+    assert legacy.value == pytest.approx(321.5)
+
+
 def test_try_parse_wrkr_json_summary() -> None:
     out = _read_fixture("wrkr_json_stdout.ndjson")
     s = try_parse_wrkr_json_summary(stdout=out, stderr="")
@@ -69,3 +135,79 @@ def test_try_parse_wrkr_json_summary() -> None:
     assert s.rps == pytest.approx(120.0)
     assert s.checks_failed_total == 0
     assert s.latency_p99_seconds == pytest.approx(0.009)
+
+
+def test_try_parse_wrkr_json_summary_uses_last_progress_line() -> None:
+    out = _read_fixture("wrkr_json_stdout_mismatched.ndjson")
+    progress = out.splitlines()[0]
+    earlier = progress.replace('"elapsedSeconds":4.0', '"elapsedSeconds":2.0')
+    assert earlier != progress
+
+    s = try_parse_wrkr_json_summary(stdout=earlier + "\n" + out, stderr="")
+    assert s is not None
+    assert s.elapsed_seconds == pytest.approx(4.0)
+
+    # stderr is written after stdout, so its progress line is the latest one.
+    s = try_parse_wrkr_json_summary(stdout=out, stderr=earlier)
+    assert s is not None
+    assert s.elapsed_seconds == pytest.approx(2.0)
+
+
+def test_iter_lines_reversed() -> None:
+    assert list(_iter_lines_reversed("a\nb\r\nc")) == ["c", "b\r", "a"]
+    assert list(_iter_lines_reversed("a\n\nb\n")) == ["", "b", "", "a"]
+    assert list(_iter_lines_reversed("")) == []
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("http_req_failed..............: 0.15% ✓ 123 ✗ 4", 0.0015),
+        ("grpc_req_failed: 100.00%", 1.0),
+        ("rate: 1.2.5%", 0.025),
+        ("rate: .5%", 0.05),
+        ("rate: n/a % then 7%", 0.07),
+        ("no percentage here", None),
+    ],
+)
+def test_parse_k6_pct_fraction(line: str, expected: float | None) -> None:
+    assert _parse_k6_pct_fraction(line) == (None if expected is None else pytest.approx(expected))
+
+
+def test_tail_lines() -> None:
+    assert tail_lines("a\nb\nc\n", 2) == "b\nc"
+    assert tail_lines("a\nb\nc", 2) == "b\nc"
+    assert tail_lines("a\nb\nc\n", 3) == "a\nb\nc\n"
+    assert tail_lines("", 12) == ""
+    assert tail_lines("a\nb", 0) == ""
+    assert tail_lines("x\n" + "y" * 10 + "\n", 1, max_chars=4) == "yyyy..."
+    assert tail_lines("abc", 1, max_chars=3) == "abc"
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("http_reqs......: 1085653 217130.6/s", 217130.6),
+        ("http_reqs...: 1085653 (217130.60000/s)", 217130.6),
+        ("iterations.....: 61234 12.3k/s", 12_300.0),
+        ("data_received..: 1.2 MB 240 kB/s", None),
+        ("grpc_reqs......: 10 a/sb 5/s", 5.0),
+        ("no rate here", None),
+    ],
+)
+def test_parse_slash_s_token(line: str, expected: float | None) -> None:
+    assert parse_slash_s_token(line) == (None if expected is None else pytest.approx(expected))
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ("running (02.0s), 000/256 VUs, 155325 complete and 0 interrupted iterations", 155325),
+        ("running (02.0s), 000/256 VUs, 1,155,325 complete and 0 interrupted iterations", 1155325),
+        ("complete and 0 interrupted iterations", None),
+        ("incomplete 12 completed", None),
+        ("x completely 7 complete", 7),
+    ],
+)
+def test_parse_k6_completed_iterations(line: str, expected: int | None) -> None:
+    assert parse_k6_completed_iterations(line) == expected
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from wrkr_tools_compare_perf.parse import Rps
+from wrkr_tools_compare_perf.report import (
+    summary_gate_line,
+    summary_gate_skipped,
+    summary_tool_line,
+)
+
+
+def _span(text: str, span: tuple[int, int] | None) -> str:
+    assert span is not None
+    return text[span[0] : span[1]]
+
+
+def test_summary_tool_line_records_status_and_rps_spans() -> None:
+    line = summary_tool_line("wrk ", "OK", Rps(value=1234.5))
+
+    assert line.text == "  wrk : OK rps=1234.500"
+    assert line.kind == "rps"
+    assert _span(line.text, line.status_span) == "OK"
+    assert [line.text[s:e] for s, e in line.rps_spans] == ["1234.500"]
+
+
+def test_summary_tool_line_without_rps() -> None:
+    assert summary_tool_line("wrkr", "FAIL").text == "  wrkr: FAIL rps=-"
+
+    skipped = summary_tool_line("k6  ", "SKIP", with_rps=False)
+    assert skipped.text == "  k6  : SKIP"
+    assert skipped.rps_spans == ()
+    assert _span(skipped.text, skipped.status_span) == "SKIP"
+
+
+def test_summary_gate_lines() -> None:
+    line = summary_gate_line("wrkr/k6 ", ratio_ok=1.4, ratio_actual=float("inf"))
+    assert line.text == "  gate wrkr/k6 : ratio_ok=1.4 ratio_actual=inf"
+    assert _span(line.text, line.ratio_span) == "inf"
+
+    skipped = summary_gate_skipped("wrkr/wrk")
+    assert skipped.text == "  gate wrkr/wrk: SKIP (correctness failed or missing tool)"
+    assert _span(skipped.text, skipped.status_span) == "SKIP"
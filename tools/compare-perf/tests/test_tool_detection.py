@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from wrkr_tools_compare_perf.config import ToolRequirements
+from wrkr_tools_compare_perf.tool_detection import (
+    ToolDetectionError,
+    _which,
+    detect_load_tools,
+    detect_server_bin,
+    exe_name,
+)
+
+
+def test_detect_server_bin_requires_built_binary(tmp_path: Path) -> None:
+    with pytest.raises(ToolDetectionError, match="wrkr-testserver"):
+        detect_server_bin(tmp_path)
+
+    release = tmp_path / "target" / "release"
+    release.mkdir(parents=True)
+    (release / exe_name("wrkr-testserver")).touch()
+
+    assert detect_server_bin(tmp_path) == release / exe_name("wrkr-testserver")
+
+
+def test_detect_load_tools_reuses_server_bin(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    release = tmp_path / "target" / "release"
+    release.mkdir(parents=True)
+    (release / exe_name("wrkr")).touch()
+    server_bin = release / exe_name("wrkr-testserver")
+
+    tools = detect_load_tools(tmp_path, ToolRequirements(), server_bin=server_bin)
+
+    assert tools.wrkr_testserver == server_bin
+    assert tools.wrk is None
+    assert tools.k6 is None
+
+    with pytest.raises(ToolDetectionError, match="k6"):
+        detect_load_tools(tmp_path, ToolRequirements(require_k6=True), server_bin=server_bin)
+
+
+def test_which_is_memoized_per_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / exe_name("fake-tool")
+    tool.touch(mode=0o755)
+
+    monkeypatch.setenv("PATH", str(tmp_path / "empty"))
+    assert _which("fake-tool") is None
+    monkeypatch.setenv("PATH", str(bin_dir))
+    assert _which("fake-tool") == tool
+    assert _which("fake-tool") is _which("fake-tool")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pytest
+
+from wrkr_tools_compare_perf.ui import RunUI
+
+
+def test_batched_log_emits_lines_on_exit(capsys: pytest.CaptureFixture[str]) -> None:
+    ui = RunUI(color="never")
+    assert not ui.live_enabled
+
+    with ui.batched_log() as log:
+        log("FAIL: one", style="red")
+        log("FAIL: two")
+        assert capsys.readouterr().out == ""
+
+    assert capsys.readouterr().out == "FAIL: one\nFAIL: two\n"
+
+
+def test_status_and_command_lines_are_rebuilt_only_after_changes(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    ui = RunUI(color="never")
+    status = ui._render_status()
+    assert ui._render_status() is status
+
+    ui.set_status({"case": "hello"})
+    assert ui._render_status().plain == "STATUS case=hello"
+
+    cmd = ui._render_command()
+    assert ui._render_command() is cmd
+    ui.set_current_command(label="wrk", argv=["wrk", "-t1"], cwd=None, env=None)
+    assert ui._render_command().plain == "CMD[wrk] wrk -t1"
+    capsys.readouterr()
+
+
+def test_tail_keeps_the_last_lines_and_renders_them_on_demand() -> None:
+    ui = RunUI(tail_lines=2, color="never")
+    ui.tail("one")
+    ui.tail_many(["two", "three"], style="dim")
+    assert ui._render_tail().plain == "TAIL\ntwo\nthree"
+
+
+def test_step_line_lists_every_in_flight_step() -> None:
+    ui = RunUI(color="never")
+    ui._live_enabled = True
+
+    def description() -> str:
+        return ui._step.tasks[0].description
+
+    with ui.step("HTTP hello"):
+        with ui.step("gRPC echo"):
+            assert description() == "HTTP hello | gRPC echo"
+        assert description() == "HTTP hello"
+    assert description() == "idle"
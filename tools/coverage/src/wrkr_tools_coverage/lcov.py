@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -9,6 +10,7 @@ class FileCoverage:
     path: Path
     total_lines: int
     hit_lines: int
+    # Sorted and free of duplicates, as built by `summarize_lcov`.
     uncovered_lines: tuple[int, ...]
 
     @property
@@ -18,11 +20,11 @@ class FileCoverage:
         return (self.hit_lines / self.total_lines) * 100.0
 
 
-def _collapse_ranges(lines: list[int]) -> list[tuple[int, int]]:
+def _collapse_ranges(lines: Sequence[int]) -> list[tuple[int, int]]:
+    """Collapse sorted, duplicate-free line numbers into inclusive `(start, end)` runs."""
     if not lines:
         return []
 
-    lines = sorted(set(lines))
     ranges: list[tuple[int, int]] = []
     start = prev = lines[0]
 
@@ -57,13 +59,18 @@ def summarize_lcov(
 
     text = lcov_path.read_text(encoding="utf-8", errors="replace")
 
+    repo_root_abs = repo_root.resolve()
     current_sf: Path | None = None
     current_da: dict[int, int] = {}
+    # Highest DA line number seen in the current record. lcov writes DA lines in ascending order,
+    # so a larger number is new and can be stored without the max-merge lookup.
+    last_da_line = -1
 
     out: list[FileCoverage] = []
 
     def flush() -> None:
-        nonlocal current_sf, current_da
+        nonlocal current_sf, current_da, last_da_line
+        last_da_line = -1
         if current_sf is None:
             return
 
@@ -80,7 +87,7 @@ def summarize_lcov(
 
         if include_under_repo_only:
             try:
-                src_abs.relative_to(repo_root.resolve())
+                src_abs.relative_to(repo_root_abs)
             except ValueError:
                 current_da = {}
                 return
@@ -105,37 +112,44 @@ def summarize_lcov(
 
         current_da = {}
 
-    for raw in text.splitlines():
-        line = raw.strip()
-
-        if line.startswith("SF:"):
-            flush()
-            current_sf = Path(line[len("SF:") :])
-            continue
-
-        if line.startswith("DA:"):
-            if current_sf is None:
+    for raw in text.split("\n"):
+        # DA records are nearly every line of a report, so they are recognized with a single
+        # prefix test and never stripped (int() ignores surrounding whitespace). Everything else
+        # takes the general path.
+        line = raw
+        if not line.startswith("DA:"):
+            line = raw.strip()
+            if line.startswith("SF:"):
+                flush()
+                current_sf = Path(line[len("SF:") :])
                 continue
-            payload = line[len("DA:") :]
-            parts = payload.split(",")
-            if len(parts) < 2:
+            if line == "end_of_record":
+                flush()
                 continue
-            try:
-                line_no = int(parts[0])
-                count = int(parts[1])
-            except ValueError:
+            if not line.startswith("DA:"):
                 continue
 
-            # lcov can repeat DA lines; keep max count.
-            prev = current_da.get(line_no)
-            if prev is None or count > prev:
-                current_da[line_no] = count
+        if current_sf is None:
+            continue
+        parts = line[len("DA:") :].split(",")
+        if len(parts) < 2:
+            continue
+        try:
+            line_no = int(parts[0])
+            count = int(parts[1])
+        except ValueError:
             continue
 
-        if line == "end_of_record":
-            flush()
+        if line_no > last_da_line:
+            current_da[line_no] = count
+            last_da_line = line_no
             continue
 
+        # lcov can repeat DA lines; keep max count.
+        prev = current_da.get(line_no)
+        if prev is None or count > prev:
+            current_da[line_no] = count
+
     flush()
 
     # Sort: lowest coverage first, then by size.
@@ -144,4 +158,4 @@ def summarize_lcov(
 
 
 def uncovered_ranges(cov: FileCoverage) -> list[tuple[int, int]]:
-    return _collapse_ranges(list(cov.uncovered_lines))
+    return _collapse_ranges(cov.uncovered_lines)
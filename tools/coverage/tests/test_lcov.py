@@ -31,3 +31,19 @@ def test_summarize_lcov_parses_and_sorts(tmp_path: Path) -> None:
 
     ranges = uncovered_ranges(items[0])
     assert ranges == [(2, 3), (10, 10)]
+
+
+def test_summarize_lcov_tolerates_crlf_and_repeated_da(tmp_path: Path) -> None:
+    repo_root = tmp_path / "repo"
+    (repo_root / "src").mkdir(parents=True)
+    (repo_root / "src" / "a.rs").write_text("// a\n")
+
+    lcov_path = tmp_path / "coverage.lcov"
+    lcov_path.write_bytes(
+        b"SF:src/a.rs\r\nDA:1,0\r\nDA:1,3\r\nDA:2,0\r\n  DA:3,1\r\nend_of_record\r\n"
+    )
+
+    (item,) = summarize_lcov(lcov_path=lcov_path, repo_root=repo_root)
+    assert item.total_lines == 3
+    assert item.hit_lines == 2
+    assert item.uncovered_lines == (2,)
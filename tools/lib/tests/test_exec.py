@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from wrkr_tools_common import exec as exec_mod
+from wrkr_tools_common.exec import run_with_peak_rss_sampling_streaming
+
+
+def test_streaming_batches_lines_and_captures_output() -> None:
+    batches: list[list[str]] = []
+    lines: list[str] = []
+
+    res = run_with_peak_rss_sampling_streaming(
+        [sys.executable, "-c", "print('a'); print('b'); print('c', end='')"],
+        on_stdout_line=lines.append,
+        on_stdout_lines=batches.append,
+    )
+
+    assert res.returncode == 0
+    assert res.stdout == "a\nb\nc\n"
+    assert lines == ["a", "b", "c"]
+    assert [line for batch in batches for line in batch] == lines
+
+
+def test_streaming_splits_on_carriage_returns_and_multibyte_boundaries() -> None:
+    # k6 redraws progress with \r; the euro sign is written one byte per flush.
+    script = (
+        "import sys, time\n"
+        "out = sys.stdout.buffer\n"
+        "out.write(b'running 1\\rrunning 2\\r\\n'); out.flush()\n"
+        "for b in '\u20ac'.encode():\n"
+        "    out.write(bytes([b])); out.flush(); time.sleep(0.01)\n"
+        "out.write(b'\\n')\n"
+    )
+    lines: list[str] = []
+
+    res = run_with_peak_rss_sampling_streaming(
+        [sys.executable, "-c", script], on_stdout_line=lines.append
+    )
+
+    assert res.returncode == 0
+    assert lines == ["running 1", "running 2", "\u20ac"]
+    assert res.stdout == "running 1\nrunning 2\n\u20ac\n"
+
+
+def test_streaming_without_callbacks_normalizes_captured_output() -> None:
+    res = run_with_peak_rss_sampling_streaming(
+        [sys.executable, "-c", "import sys; sys.stdout.write('a\\r\\n\\nb\\rc')"]
+    )
+
+    assert res.returncode == 0
+    assert res.stdout == "a\nb\nc\n"
+    assert res.stderr == ""
+
+
+def test_streaming_samples_rss_until_exit_and_keeps_returncode() -> None:
+    res = run_with_peak_rss_sampling_streaming(
+        [sys.executable, "-c", "import time, sys; time.sleep(0.2); sys.exit(3)"],
+        sample_interval_s=0.01,
+    )
+
+    assert res.returncode == 3
+    if sys.platform.startswith("linux"):
+        assert res.peak_rss_bytes > 0
+
+
+def test_streaming_with_callbacks_captures_the_decoded_lines(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    decoded: list[bytes] = []
+    real_decode = exec_mod._decode_captured
+
+    def spy(data: bytearray) -> str:
+        decoded.append(bytes(data))
+        return real_decode(data)
+
+    monkeypatch.setattr(exec_mod, "_decode_captured", spy)
+
+    res = run_with_peak_rss_sampling_streaming(
+        [
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.write('a\\r\\n\\nb\\rc'); sys.stderr.write('e')",
+        ],
+        on_stdout_lines=lambda _batch: None,
+        on_stderr_line=lambda _line: None,
+    )
+
+    assert res.stdout == "a\nb\nc\n"
+    assert res.stderr == "e\n"
+    assert decoded == []
@@ -11,6 +11,7 @@ Provides:
 
 from __future__ import annotations
 
+import codecs
 import os
 import shlex
 import subprocess
@@ -206,6 +207,8 @@ def run_with_peak_rss_sampling_streaming(
     sample_interval_s: float = 0.05,
     on_stdout_line=None,
     on_stderr_line=None,
+    on_stdout_lines=None,
+    on_stderr_lines=None,
 ) -> RunResult:
     """Execute subprocess while streaming output via callbacks.
 
@@ -213,6 +216,10 @@ def run_with_peak_rss_sampling_streaming(
     concurrently, calling `on_stdout_line(line)` / `on_stderr_line(line)` for
     each parsed line-like chunk (splits on `\n` and `\r`).
 
+    `on_stdout_lines(lines)` / `on_stderr_lines(lines)` are batch variants: they are
+    called once per pipe read with every line completed by that read. Prefer them for
+    chatty tools (e.g. cargo) where a per-line callback is pure overhead.
+
     Output is still fully captured and returned in the `RunResult`.
     """
     if not argv:
@@ -238,43 +245,31 @@ def run_with_peak_rss_sampling_streaming(
         bufsize=0,
     )
 
-    peak_lock = threading.Lock()
-    peak_rss: int = 0
-    stop = threading.Event()
+    # Each output is decoded exactly once. With a callback the decoded lines handed to it are
+    # also the capture; without one the raw bytes are kept and decoded at the end (see
+    # `_decode_captured`).
+    out_buf = bytearray()
+    err_buf = bytearray()
+    out_lines: list[str] = []
+    err_lines: list[str] = []
 
-    def sampler() -> None:
-        nonlocal peak_rss
-        while not stop.is_set():
-            rss = _read_rss_bytes_best_effort(proc.pid)
-            if rss is not None:
-                with peak_lock:
-                    if rss > peak_rss:
-                        peak_rss = rss
-            time.sleep(sample_interval_s)
-
-    out_chunks: list[str] = []
-    err_chunks: list[str] = []
-
-    def _iter_lines_from_bytes(chunks: Iterable[bytes]) -> Iterable[str]:
+    def _iter_line_batches(chunks: Iterable[bytes]) -> Iterable[list[str]]:
         # Split on both \n and \r so tools like k6 that redraw a single line still show updates.
+        # Each chunk is decoded and split in one pass; only the trailing partial line is carried
+        # over. The incremental decoder keeps multi-byte characters split across reads intact.
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
         buf = ""
         for b in chunks:
-            buf += b.decode("utf-8", errors="replace")
-            while True:
-                idx_n = buf.find("\n")
-                idx_r = buf.find("\r")
-                idxs = [i for i in (idx_n, idx_r) if i != -1]
-                if not idxs:
-                    break
-                i = min(idxs)
-                line = buf[:i]
-                buf = buf[i + 1 :]
-                if line:
-                    yield line
+            parts = (buf + decoder.decode(b)).replace("\r", "\n").split("\n")
+            buf = parts.pop()
+            batch = [line for line in parts if line]
+            if batch:
+                yield batch
+        buf += decoder.decode(b"", final=True)
         if buf:
-            yield buf
+            yield [buf]
 
-    def _reader(pipe, *, sink: list[str], cb) -> None:
+    def _reader(pipe, *, sink: bytearray, lines: list[str], cb, batch_cb) -> None:
         if pipe is None:
             return
         try:
@@ -286,50 +281,100 @@ def run_with_peak_rss_sampling_streaming(
                         break
                     yield b
 
-            for line in _iter_lines_from_bytes(chunk_iter()):
-                sink.append(line + "\n")
+            if cb is None and batch_cb is None:
+                for b in chunk_iter():
+                    sink.extend(b)
+                return
+
+            for batch in _iter_line_batches(chunk_iter()):
+                lines.extend(batch)
                 if cb is not None:
+                    for line in batch:
+                        with suppress(Exception):
+                            cb(line)
+                if batch_cb is not None:
                     with suppress(Exception):
-                        cb(line)
+                        batch_cb(batch)
         finally:
             with suppress(Exception):
                 pipe.close()
 
-    t_sampler = threading.Thread(target=sampler, name="rss-sampler", daemon=True)
     t_out = threading.Thread(
         target=_reader,
         args=(proc.stdout,),
-        kwargs={"sink": out_chunks, "cb": on_stdout_line},
+        kwargs={
+            "sink": out_buf,
+            "lines": out_lines,
+            "cb": on_stdout_line,
+            "batch_cb": on_stdout_lines,
+        },
         daemon=True,
     )
     t_err = threading.Thread(
         target=_reader,
         args=(proc.stderr,),
-        kwargs={"sink": err_chunks, "cb": on_stderr_line},
+        kwargs={
+            "sink": err_buf,
+            "lines": err_lines,
+            "cb": on_stderr_line,
+            "batch_cb": on_stderr_lines,
+        },
         daemon=True,
     )
 
-    t_sampler.start()
     t_out.start()
     t_err.start()
 
-    returncode = proc.wait()
-    stop.set()
+    # The reader threads own the pipes, so this thread is free to sample RSS while it waits.
+    returncode, peak = _wait_sampling_peak_rss(proc, sample_interval_s)
     t_out.join(timeout=2.0)
     t_err.join(timeout=2.0)
-    t_sampler.join(timeout=1.0)
-
-    with peak_lock:
-        peak = peak_rss
 
     return RunResult(
         returncode=int(returncode or 0),
-        stdout="".join(out_chunks),
-        stderr="".join(err_chunks),
+        stdout=_captured_text(out_buf, out_lines),
+        stderr=_captured_text(err_buf, err_lines),
         peak_rss_bytes=int(peak),
     )
 
 
+def _wait_sampling_peak_rss(proc: subprocess.Popen, interval_s: float) -> tuple[int, int]:
+    """Wait for `proc` to exit, sampling its RSS every `interval_s`.
+
+    Returns (returncode, peak RSS bytes). Unlike a sampler thread, this returns as soon as
+    the process exits instead of finishing a sleep first.
+    """
+    peak = 0
+    while True:
+        rss = _read_rss_bytes_best_effort(proc.pid)
+        if rss is not None and rss > peak:
+            peak = rss
+        try:
+            return proc.wait(timeout=interval_s), peak
+        except subprocess.TimeoutExpired:
+            continue
+
+
+def _captured_text(data: bytearray, lines: list[str]) -> str:
+    """Return one pipe's captured output.
+
+    A pipe read for callbacks fills `lines` and leaves `data` empty, so its lines are joined
+    rather than decoded a second time; otherwise the raw bytes are decoded.
+    """
+    if data:
+        return _decode_captured(data)
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _decode_captured(data: bytearray) -> str:
+    """Decode captured output with the same normalization the line callbacks see.
+
+    `\r` and `\n` both end a line, empty lines are dropped and every line ends with `\n`.
+    """
+    text = data.decode("utf-8", errors="replace").replace("\r", "\n")
+    return "".join(f"{line}\n" for line in text.split("\n") if line)
+
+
 def run_checked(
     argv: Sequence[str | os.PathLike[str]],
     *,
@@ -392,6 +437,8 @@ def run_checked_streaming(
     label: str | None = None,
     on_stdout_line=None,
     on_stderr_line=None,
+    on_stdout_lines=None,
+    on_stderr_lines=None,
 ) -> RunResult:
     """Streaming variant of `run_checked` (see `run_with_peak_rss_sampling_streaming`)."""
     if label is not None:
@@ -404,6 +451,8 @@ def run_checked_streaming(
         stdin=stdin,
         on_stdout_line=on_stdout_line,
         on_stderr_line=on_stderr_line,
+        on_stdout_lines=on_stdout_lines,
+        on_stderr_lines=on_stderr_lines,
     )
 
     if res.returncode != 0: